@@ -21,11 +21,15 @@ logger.info("APP: Logging system initialized")
 
 # Import config AFTER logging is set up
 from config import firebase_init  # noqa: F401 E402
+from data_access import firestore_pool  # noqa: E402
+
+# Open Firestore channels in the background so the first request skips that setup
+firestore_pool.warm_up()
 
 # Log system information
-logger.info(f"APP: Python version: {sys.version}")
-logger.info(f"APP: Running on platform: {sys.platform}")
-logger.info(f"APP: Current working directory: {os.getcwd()}")
+logger.info("APP: Python version: %s", sys.version)
+logger.info("APP: Running on platform: %s", sys.platform)
+logger.info("APP: Current working directory: %s", os.getcwd())
 
 # Initialize Flask application
 app = Flask(__name__)
@@ -56,10 +60,10 @@ for bp_name, blueprint in [
     app.register_blueprint(blueprint)
     blueprint_count += 1
     logger.debug(
-        f"APP: Registered blueprint '{bp_name}' with prefix '{blueprint.url_prefix}'"
+        "APP: Registered blueprint '%s' with prefix '%s'", bp_name, blueprint.url_prefix
     )
 
-logger.info(f"APP: Successfully registered {blueprint_count} blueprints")
+logger.info("APP: Successfully registered %s blueprints", blueprint_count)
 
 
 # Request/response logging middleware
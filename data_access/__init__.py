@@ -5,6 +5,7 @@ from . import (
     admin_dal,
     admin_student_dal,
     category_dal,
+    firestore_pool,
     score_history_dal,
     search_dal,
     user_dal,
@@ -21,4 +22,5 @@ __all__ = [
     "word_dal",
     "admin_student_dal",
     "score_history_dal",
+    "firestore_pool",
 ]
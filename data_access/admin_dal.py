@@ -1,22 +1,39 @@
 """Admin Data Access Layer"""
 
 import logging
+import os
+import threading
 
+from cachetools import TTLCache, cached
 from firebase_admin import firestore
+from google.cloud.firestore_v1.field_path import FieldPath
 
 from utils import DatabaseError
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# Admin membership changes rarely, so the full set of admin IDs is cached for a
+# short time. Every write to the 'admins' collection below invalidates it, so
+# the TTL only bounds staleness across processes. Override with the
+# ADMIN_IDS_CACHE_TTL environment variable (seconds).
+ADMIN_IDS_CACHE_TTL_SECONDS = float(os.environ.get("ADMIN_IDS_CACHE_TTL", 30))
+_admin_ids_cache = TTLCache(maxsize=1, ttl=ADMIN_IDS_CACHE_TTL_SECONDS)
 
-def get_all_admin_ids(db) -> set:
+
+def invalidate_admin_ids_cache() -> None:
+    """Drops the cached admin ID set so the next lookup hits Firestore."""
+    logger.debug("DAL: Invalidating cached admin IDs.")
+    _admin_ids_cache.clear()
+
+
+@cached(_admin_ids_cache, key=lambda db: "admin_ids", lock=threading.Lock())
+def get_all_admin_ids(db) -> frozenset:
     """Retrieves a set of all user IDs that are admins for quick lookups."""
     logger.info("DAL: Getting all admin IDs.")
     try:
-        admin_ids = set()
-        docs = db.collection("admins").stream()
-        for doc in docs:
-            admin_ids.add(doc.id)
+        # Only the document IDs are needed, so project away every field.
+        docs = db.collection("admins").select([FieldPath.document_id()]).stream()
+        admin_ids = frozenset(doc.id for doc in docs)
 
         logger.info(f"DAL: Found {len(admin_ids)} admin documents.")
         return admin_ids
@@ -37,6 +54,7 @@ def promote_user_to_admin(db, user_id_to_promote: str, assigning_admin_id: str)
                 "assignedAt": firestore.SERVER_TIMESTAMP,
             }
         )
+        invalidate_admin_ids_cache()
         return True
     except Exception as e:
         logger.error(f"DAL: Failed to promote user {user_id_to_promote}: {e}")
@@ -49,6 +67,7 @@ def update_admin_role(db, user_id: str, new_role: str) -> bool:
     try:
         doc_ref = db.collection("admins").document(user_id)
         doc_ref.update({"role": new_role, "updatedAt": firestore.SERVER_TIMESTAMP})
+        invalidate_admin_ids_cache()
         return True
     except Exception as e:
         logger.error(f"DAL: Failed to update role for admin {user_id}: {e}")
@@ -60,6 +79,7 @@ def demote_admin(db, user_id_to_demote: str) -> bool:
     logger.info(f"DAL: Demoting admin {user_id_to_demote}.")
     try:
         db.collection("admins").document(user_id_to_demote).delete()
+        invalidate_admin_ids_cache()
         return True
     except Exception as e:
         logger.error(f"DAL: Failed to demote admin {user_id_to_demote}: {e}")
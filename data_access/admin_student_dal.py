@@ -5,8 +5,9 @@ This layer interacts with the 'admin_student_relations' collection.
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from models import User
 from utils import DatabaseError
 
 logger = logging.getLogger("infinite_vocab_app")
@@ -80,15 +81,55 @@ def get_students_for_admin(db, admin_id: str) -> List[str]:
     logger.info(f"DAL: Getting all students for admin_id: {admin_id}")
     try:
         student_ids = []
-        query = db.collection("admin_student_relations").where(
-            "admin_id", "==", admin_id
+        query = (
+            db.collection("admin_student_relations")
+            .where("admin_id", "==", admin_id)
+            .select(["student_id"])
         )
         docs = query.stream()
         for doc in docs:
-            student_ids.append(doc.to_dict().get("student_id"))
+            student_ids.append(doc.get("student_id"))
 
         logger.info(f"DAL: Found {len(student_ids)} students for admin {admin_id}.")
         return student_ids
     except Exception as e:
         logger.error(f"DAL: Failed to get students for admin {admin_id}: {e}")
         raise DatabaseError("Failed to retrieve students for admin.") from e
+
+
+def validate_assignment(
+    db, student_id: str
+) -> Tuple[Optional[User], bool, Optional[dict]]:
+    """
+    Gathers everything needed to validate assigning a student in as few reads as possible.
+
+    The student's user document and their (possible) admin document are fetched
+    together in a single batched read, followed by the existing-link lookup.
+    Returns a tuple of (student, is_admin, existing_link).
+    """
+    logger.info(f"DAL: Validating assignment preconditions for student {student_id}.")
+    try:
+        user_ref = db.collection("users").document(student_id)
+        admin_ref = db.collection("admins").document(student_id)
+
+        student = None
+        is_admin = False
+        for snapshot in db.get_all([user_ref, admin_ref]):
+            if not snapshot.exists:
+                continue
+            if snapshot.reference.path == user_ref.path:
+                db_data = snapshot.to_dict()
+                db_data["user_id"] = snapshot.id
+                student = User.model_validate(db_data)
+            else:
+                is_admin = True
+
+        existing_link = get_link_by_student_id(db, student_id)
+        return student, is_admin, existing_link
+    except DatabaseError:
+        raise
+    except Exception as e:
+        logger.error(
+            f"DAL: Failed to validate assignment for student_id {student_id}: {e}"
+        )
+        raise DatabaseError("Failed to validate student assignment.") from e
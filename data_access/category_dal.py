@@ -72,6 +72,41 @@ def get_categories_by_user(db, user_id: str) -> List[Category]:
         raise DatabaseError(f"Failed to get categories: {str(e)}") from e
 
 
+def get_category_by_name_for_user(
+    db, user_id: str, name_search: str
+) -> Optional[Category]:
+    """
+    Finds a user's category by its normalized search name, expects 0 or 1 result.
+
+    Matches against the persisted category_name_search field (as produced by
+    CategoryFactory), so duplicate checks cost a single indexed lookup instead
+    of a scan of every category.
+    """
+    logger.info(
+        f"DAL: Finding category by name '{name_search}' for user {user_id} (case-insensitive)."
+    )
+    try:
+        query = (
+            db.collection("categories")
+            .where("user_id", "==", user_id)
+            .where("category_name_search", "==", name_search)
+            .limit(1)
+        )
+        docs = list(query.stream())
+        if not docs:
+            return None
+
+        data = docs[0].to_dict()
+        data["category_id"] = docs[0].id
+        return Category.model_validate(data)
+    except Exception as e:
+        logger.error(
+            f"DAL: Failed to find category by name for user {user_id}: {e}",
+            exc_info=True,
+        )
+        raise DatabaseError(f"Failed to find category by name: {str(e)}") from e
+
+
 def get_category_by_id(db, category_id: str) -> Optional[Category]:
     """Get category by ID."""
     logger.info(f"DAL: Getting category by ID: {category_id}.")
@@ -116,17 +151,35 @@ def update_category(db, category_id: str, updates: dict) -> Optional[Category]:
         raise DatabaseError(f"Failed to update category: {str(e)}") from e
 
 
+@firestore.transactional
+def _delete_if_owned(transaction, doc_ref, user_id: str) -> bool:
+    """Deletes the category inside the transaction only if user_id owns it."""
+    snapshot = doc_ref.get(transaction=transaction)
+    if not snapshot.exists or snapshot.get("user_id") != user_id:
+        return False
+
+    transaction.delete(doc_ref)
+    return True
+
+
 @timed_execution(logger, "Category Deletion")
-def delete_category(db, category_id: str) -> bool:
-    """Delete category by ID."""
-    logger.info(f"DAL: Deleting category {category_id}.")
+def delete_category(db, category_id: str, user_id: str) -> bool:
+    """
+    Delete category by ID if it belongs to the user.
+
+    The ownership read and the delete share one transaction, so no separate
+    lookup is needed beforehand. Returns False if the category does not
+    exist or is owned by someone else.
+    """
+    logger.info(f"DAL: Deleting category {category_id} for user {user_id}.")
     try:
         doc_ref = db.collection("categories").document(category_id)
-        if not doc_ref.get().exists:
-            logger.warning(f"DAL: Category {category_id} not found for deletion.")
+        if not _delete_if_owned(db.transaction(), doc_ref, user_id):
+            logger.warning(
+                f"DAL: Category {category_id} not found for deletion by user {user_id}."
+            )
             return False
 
-        doc_ref.delete()
         logger.info(f"DAL: Successfully deleted category {category_id}.")
         return True
     except Exception as e:
@@ -0,0 +1,75 @@
+import logging
+import os
+import random
+import threading
+
+import firebase_admin
+from firebase_admin import firestore
+
+logger = logging.getLogger("infinite_vocab_app")
+
+# Number of Firestore clients (each with its own gRPC channel) shared by all
+# requests. The default of 1 keeps the single firebase_admin client.
+FIRESTORE_CLIENT_POOL_SIZE = max(
+    1, int(os.environ.get("FIRESTORE_CLIENT_POOL_SIZE", 1))
+)
+
+# Collection used by the startup warm-up read; the document never has to exist
+WARMUP_COLLECTION = "_warmup"
+
+_clients = []
+_clients_lock = threading.Lock()
+
+
+def _build_clients():
+    """Creates the pool: the firebase_admin client plus extra clients on the same app."""
+    clients = [firestore.client()]
+    if FIRESTORE_CLIENT_POOL_SIZE > 1:
+        app = firebase_admin.get_app()
+        credentials = app.credential.get_credential()
+        for _ in range(FIRESTORE_CLIENT_POOL_SIZE - 1):
+            clients.append(
+                firestore.Client(credentials=credentials, project=app.project_id)
+            )
+    logger.info("DAL: Firestore client pool ready with %s client(s)", len(clients))
+    return clients
+
+
+def get_client():
+    """
+    Returns a Firestore client from the process-wide pool.
+
+    Clients are created on first use, after the Firebase app is initialized,
+    and reused for the life of the process so channels and auth tokens stay warm.
+    """
+    if not _clients:
+        with _clients_lock:
+            if not _clients:
+                _clients.extend(_build_clients())
+    return random.choice(_clients)
+
+
+def _warm_up_clients():
+    """Builds the pool and opens every client's channel with one point read."""
+    try:
+        get_client()
+        for client in _clients:
+            client.collection(WARMUP_COLLECTION).document("ping").get()
+        logger.info("DAL: Warmed up %s Firestore client(s)", len(_clients))
+    except Exception as e:
+        # A failed warm-up only means the first request pays the setup cost
+        logger.warning("DAL: Firestore warm-up failed: %s", e)
+
+
+def warm_up():
+    """
+    Opens the pool's gRPC channels on a background thread at startup.
+
+    The first request otherwise pays for channel setup and the auth token
+    fetch. Disabled with FIRESTORE_WARMUP=false.
+    """
+    if os.environ.get("FIRESTORE_WARMUP", "true").lower() == "false":
+        return
+    threading.Thread(
+        target=_warm_up_clients, name="firestore-warmup", daemon=True
+    ).start()
@@ -32,6 +32,8 @@ def search_words_by_name(db, user_id: str, query: str) -> List:
                     "word_text_search", "<=", query_lower + "\uf8ff"
                 )
             )
+            # Results only display the word text, so skip the rest of the doc.
+            .select(["word_text"])
         )
 
         results = list(query_ref.stream())
@@ -73,6 +75,7 @@ def search_categories_by_name(db, user_id: str, query: str) -> List:
                     "category_name_search", "<=", query_lower + "\uf8ff"
                 )
             )
+            .select(["category_name"])
         )
 
         results = list(query_ref.stream())
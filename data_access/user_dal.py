@@ -1,22 +1,28 @@
 """User Data Access Layer"""
 
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 from firebase_admin import firestore
+from google.api_core.exceptions import AlreadyExists
 
-from data_access import admin_dal as a_dal
 from models import User
-from utils import DatabaseError, timed_execution
+from utils import DatabaseError, DuplicateEntryError, timed_execution
 
 logger = logging.getLogger("infinite_vocab_app")
 
 
 @timed_execution(logger, "User Creation")
 def create_user(db, user: User) -> User:
-    """Saves a new user to Firestore and returns the created user."""
+    """
+    Saves a new user to Firestore and returns the created user.
 
-    logger.info(f"DAL: Creating user document for user_id: {user.user_id}")
+    Uses create() rather than set(), so the write fails instead of overwriting
+    when the document already exists (e.g. a concurrent first sign-in).
+    Raises DuplicateEntryError in that case.
+    """
+
+    logger.info("DAL: Creating user document for user_id: %s", user.user_id)
     try:
         user_data = {
             "user_name": user.user_name,
@@ -26,33 +32,40 @@ def create_user(db, user: User) -> User:
             "updatedAt": firestore.SERVER_TIMESTAMP,
         }
         doc_ref = db.collection("users").document(user.user_id)
-        doc_ref.set(user_data)
-
-        created_doc = doc_ref.get()
-        logger.info(
-            f"DAL: Successfully created user document with ID: {created_doc.id}"
+        write_result = doc_ref.create(user_data)
+        logger.info("DAL: Successfully created user document with ID: %s", doc_ref.id)
+
+        # SERVER_TIMESTAMP resolves to the commit time, which the write result
+        # already carries, so the timestamps are filled in without a re-read.
+        return user.model_copy(
+            update={
+                "created_at": write_result.update_time,
+                "updated_at": write_result.update_time,
+            }
         )
 
-        # Re-create the model from the DB data to include server-side timestamps
-        db_data = created_doc.to_dict()
-        db_data["user_id"] = created_doc.id
-        return User.model_validate(db_data)
-
+    except AlreadyExists as e:
+        logger.warning(
+            "DAL: User document already exists for user_id: %s", user.user_id
+        )
+        raise DuplicateEntryError(f"User '{user.user_id}' already exists.") from e
     except Exception as e:
-        logger.error(f"DAL: Failed to create user {user.user_id}: {e}", exc_info=True)
+        logger.error(
+            "DAL: Failed to create user %s: %s", user.user_id, e, exc_info=True
+        )
         raise DatabaseError(f"Failed to create user: {e}") from e
 
 
 @timed_execution(logger, "User Retrieval")
 def get_user_by_id(db, user_id: str) -> Optional[User]:
     """Gets a user from Firestore by their document ID."""
-    logger.info(f"DAL: Getting user document for user_id: {user_id}")
+    logger.debug("DAL: Getting user document for user_id: %s", user_id)
     try:
         doc_ref = db.collection("users").document(user_id)
         doc = doc_ref.get()
 
         if not doc.exists:
-            logger.warning(f"DAL: User document not found for user_id: {user_id}")
+            logger.warning("DAL: User document not found for user_id: %s", user_id)
             return None
 
         # Unpack the dictionary from Firestore and add the document ID
@@ -61,7 +74,7 @@ def get_user_by_id(db, user_id: str) -> Optional[User]:
         return User.model_validate(db_data)
 
     except Exception as e:
-        logger.error(f"DAL: Failed to get user by ID {user_id}: {e}", exc_info=True)
+        logger.error("DAL: Failed to get user by ID %s: %s", user_id, e, exc_info=True)
         raise DatabaseError(f"Failed to get user by ID: {e}") from e
 
 
@@ -69,7 +82,9 @@ def get_user_by_id(db, user_id: str) -> Optional[User]:
 def update_user(db, user_id: str, updates: dict) -> Optional[User]:
     """Updates a user document in Firestore."""
     logger.info(
-        f"DAL: Updating user document for user_id: {user_id} with keys {list(updates.keys())}"
+        "DAL: Updating user document for user_id: %s with keys %s",
+        user_id,
+        list(updates.keys()),
     )
     try:
         doc_ref = db.collection("users").document(user_id)
@@ -77,7 +92,7 @@ def update_user(db, user_id: str, updates: dict) -> Optional[User]:
 
         if not doc.exists:
             logger.warning(
-                f"DAL: User document not found for update for user_id: {user_id}"
+                "DAL: User document not found for update for user_id: %s", user_id
             )
             return None
 
@@ -85,46 +100,96 @@ def update_user(db, user_id: str, updates: dict) -> Optional[User]:
         doc_ref.update(updates)
 
         updated_doc = doc_ref.get()
-        logger.info(f"DAL: Successfully updated user document for user_id: {user_id}")
+        logger.info("DAL: Successfully updated user document for user_id: %s", user_id)
         db_data = updated_doc.to_dict()
         db_data["user_id"] = updated_doc.id
         return User.model_validate(db_data)
 
     except Exception as e:
-        logger.error(f"DAL: Failed to update user {user_id}: {e}", exc_info=True)
+        logger.error("DAL: Failed to update user %s: %s", user_id, e, exc_info=True)
         raise DatabaseError(f"Failed to update user: {e}") from e
 
 
-@timed_execution(logger, "User Listing")
-def list_all_users(db) -> list[User]:
-    """Retrieves all user documents from the users collection."""
+@firestore.transactional
+def _set_code_if_missing(transaction, doc_ref, new_code: str) -> Optional[dict]:
+    """Writes new_code inside the transaction only if the user has no code yet."""
+    snapshot = doc_ref.get(transaction=transaction)
+    if not snapshot.exists:
+        return None
+
+    user_data = snapshot.to_dict()
+    if not user_data.get("user_code"):
+        transaction.update(
+            doc_ref,
+            {"user_code": new_code, "updatedAt": firestore.SERVER_TIMESTAMP},
+        )
+        user_data["user_code"] = new_code
+    return user_data
+
+
+@timed_execution(logger, "User Code Backfill")
+def ensure_user_code(db, user_id: str, new_code: str) -> Optional[User]:
+    """
+    Assigns new_code to a user that is missing a user_code.
 
-    logger.info("DAL: Listing all user documents.")
+    The read and the write share one transaction, so concurrent logins cannot
+    both assign a code; whichever commits first wins and the other sees its
+    code. The returned user is built from the transaction snapshot rather than
+    re-read, so its updated_at is the value from before the write.
+    """
+    logger.info("DAL: Ensuring user_code for user_id: %s", user_id)
     try:
-        users = []
+        doc_ref = db.collection("users").document(user_id)
+        user_data = _set_code_if_missing(db.transaction(), doc_ref, new_code)
+        if user_data is None:
+            logger.warning(
+                "DAL: User document not found for code backfill for user_id: %s",
+                user_id,
+            )
+            return None
 
-        docs = db.collection("users").stream()
-        for doc in docs:
+        user_data["user_id"] = user_id
+        return User.model_validate(user_data)
+
+    except Exception as e:
+        logger.error(
+            "DAL: Failed to ensure user_code for %s: %s", user_id, e, exc_info=True
+        )
+        raise DatabaseError(f"Failed to ensure user code: {e}") from e
+
+
+def stream_all_users(db) -> Iterator[User]:
+    """
+    Lazily yields every user document from the users collection.
+
+    Documents are read from the Firestore stream cursor one at a time, so the
+    full collection is never held in memory.
+    """
+
+    logger.debug("DAL: Streaming all user documents.")
+    try:
+        count = 0
+        for doc in db.collection("users").stream():
             db_data = doc.to_dict()
             db_data["user_id"] = doc.id
-            users.append(User.model_validate(db_data))
-        logger.info(f"DAL: Retrieved {len(users)} total users.")
-        return users
+            count += 1
+            yield User.model_validate(db_data)
+        logger.debug("DAL: Streamed %s total users.", count)
 
     except Exception as e:
-        logger.error(f"DAL: Failed to list all users: {e}", exc_info=True)
+        logger.error("DAL: Failed to stream all users: %s", e, exc_info=True)
         raise DatabaseError(f"Failed to list all users: {e}") from e
 
 
 @timed_execution(logger, "User Code Lookup")
 def get_user_by_code(db, user_code: str) -> Optional[User]:
     """Gets a user from Firestore by their unique user_code."""
-    logger.info(f"DAL: Getting user by user_code: {user_code}")
+    logger.debug("DAL: Getting user by user_code: %s", user_code)
     try:
         query = db.collection("users").where("user_code", "==", user_code).limit(1)
         docs = list(query.stream())
         if not docs:
-            logger.warning(f"DAL: No user found with user_code: {user_code}")
+            logger.warning("DAL: No user found with user_code: %s", user_code)
             return None
 
         doc = docs[0]
@@ -132,14 +197,16 @@ def get_user_by_code(db, user_code: str) -> Optional[User]:
         db_data["user_id"] = doc.id
         return User.model_validate(db_data)
     except Exception as e:
-        logger.error(f"DAL: Failed to get user by code {user_code}: {e}", exc_info=True)
+        logger.error(
+            "DAL: Failed to get user by code %s: %s", user_code, e, exc_info=True
+        )
         raise DatabaseError(f"Failed to get user by code: {e}") from e
 
 
 @timed_execution(logger, "Leaderboard Query")
 def get_users_for_leaderboard(db, limit: int = 20) -> list[User]:
-    """Retrieves a list of users sorted by total_score descending for the leaderboard."""
-    logger.info(f"DAL: Getting top {limit} users for leaderboard.")
+    """Retrieves the top users by total_score, descending, for the leaderboard."""
+    logger.debug("DAL: Getting top %s users for leaderboard.", limit)
     try:
         users = []
         query = (
@@ -154,17 +221,9 @@ def get_users_for_leaderboard(db, limit: int = 20) -> list[User]:
             db_data["user_id"] = doc.id
             users.append(User.model_validate(db_data))
 
-        # Get the set of all admin IDs
-        admin_ids = a_dal.get_all_admin_ids(db)
-
-        # Filter out any users who are admins
-        non_admin_users = [user for user in users if user.user_id not in admin_ids]
-
-        logger.info(
-            f"DAL: Retrieved {len(non_admin_users)} non-admin users for leaderboard."
-        )
-        return non_admin_users  # Return the filtered list
+        logger.debug("DAL: Retrieved %s users for leaderboard.", len(users))
+        return users
 
     except Exception as e:
-        logger.error(f"DAL: Failed to list users for leaderboard: {e}", exc_info=True)
+        logger.error("DAL: Failed to list users for leaderboard: %s", e, exc_info=True)
         raise DatabaseError(f"Failed to list users for leaderboard: {e}") from e
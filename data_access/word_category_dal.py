@@ -1,25 +1,34 @@
 """Word-Category Link Data Access Layer"""
 
 import logging
-from typing import List
+from typing import Iterator
 
 from firebase_admin import firestore
+from google.api_core.exceptions import AlreadyExists
 
-from utils import DatabaseError
+from utils import DatabaseError, DuplicateEntryError
 
 logger = logging.getLogger("infinite_vocab_app")
 
 
 def link_word_to_category(db, user_id: str, word_id: str, category_id: str) -> None:
-    """Creates a link document between a word and a category."""
+    """
+    Creates the link document between a word and a category.
+
+    The link id is deterministic, so create() doubles as the existence check.
+    Raises DuplicateEntryError if the word is already in the category.
+    """
     link_id = f"{word_id}_{category_id}"
     logger.info(
-        f"DAL: Linking word {word_id} to category {category_id} with link_id {link_id}."
+        "DAL: Linking word %s to category %s with link_id %s.",
+        word_id,
+        category_id,
+        link_id,
     )
     try:
         link_ref = db.collection("word_categories").document(link_id)
 
-        link_ref.set(
+        link_ref.create(
             {
                 "word_id": word_id,
                 "category_id": category_id,
@@ -27,9 +36,15 @@ def link_word_to_category(db, user_id: str, word_id: str, category_id: str) -> N
                 "createdAt": firestore.SERVER_TIMESTAMP,
             }
         )
+    except AlreadyExists as e:
+        logger.warning("DAL: Link %s already exists.", link_id)
+        raise DuplicateEntryError("Word is already in this category.") from e
     except Exception as e:
         logger.error(
-            f"DAL: Failed to link word '{word_id}' to category '{category_id}': {e}"
+            "DAL: Failed to link word '%s' to category '%s': %s",
+            word_id,
+            category_id,
+            e,
         )
         raise DatabaseError(
             f"Failed to link word '{word_id}' to category '{category_id}': {e}"
@@ -40,13 +55,19 @@ def unlink_word_from_category(db, word_id: str, category_id: str) -> None:
     """Deletes the link document between a word and a category."""
     link_id = f"{word_id}_{category_id}"
     logger.info(
-        f"DAL: Unlinking word {word_id} from category {category_id} with link_id {link_id}."
+        "DAL: Unlinking word %s from category %s with link_id %s.",
+        word_id,
+        category_id,
+        link_id,
     )
     try:
         db.collection("word_categories").document(link_id).delete()
     except Exception as e:
         logger.error(
-            f"DAL: Failed to unlink word '{word_id}' from category '{category_id}': {e}"
+            "DAL: Failed to unlink word '%s' from category '%s': %s",
+            word_id,
+            category_id,
+            e,
         )
         raise DatabaseError(
             f"Failed to unlink word '{word_id}' from category '{category_id}': {e}"
@@ -56,34 +77,42 @@ def unlink_word_from_category(db, word_id: str, category_id: str) -> None:
 def check_link_exists(db, word_id: str, category_id: str) -> bool:
     """Checks if a link between a word and category exists."""
     link_id = f"{word_id}_{category_id}"
-    logger.info(f"DAL: Checking if link exists for link_id {link_id}.")
+    logger.debug("DAL: Checking if link exists for link_id %s.", link_id)
     try:
         link_ref = db.collection("word_categories").document(link_id)
         return link_ref.get().exists
     except Exception as e:
         logger.error(
-            f"DAL: Failed to check link for word '{word_id}' and category '{category_id}': {e}"
+            "DAL: Failed to check link for word '%s' and category '%s': %s",
+            word_id,
+            category_id,
+            e,
         )
         raise DatabaseError(
             f"Failed to check link for word '{word_id}' and category '{category_id}': {e}"
         ) from e
 
 
-def get_word_ids_by_category_id(db, category_id: str) -> List[str]:
-    """Retrieves all word_ids linked to a specific category_id."""
-    logger.info(f"DAL: Getting word_ids for category_id {category_id}.")
+def get_word_ids_by_category_id(db, category_id: str) -> Iterator[str]:
+    """
+    Yields the word_ids linked to a specific category_id as the links stream in.
+
+    Callers can start fetching the first words before the link query finishes.
+    """
+    logger.debug("DAL: Getting word_ids for category_id %s.", category_id)
     try:
-        word_ids = []
-        query = db.collection("word_categories").where("category_id", "==", category_id)
-        docs = query.stream()
-        for doc in docs:
-            word_ids.append(doc.to_dict()["word_id"])
-        logger.info(
-            f"DAL: Found {len(word_ids)} words linked to category {category_id}."
+        query = (
+            db.collection("word_categories")
+            .where("category_id", "==", category_id)
+            .select(["word_id"])
         )
-        return word_ids
+        found = 0
+        for doc in query.stream():
+            found += 1
+            yield doc.get("word_id")
+        logger.debug("DAL: Found %s words linked to category %s.", found, category_id)
     except Exception as e:
-        logger.error(f"DAL: Failed to get words for category '{category_id}': {e}")
+        logger.error("DAL: Failed to get words for category '%s': %s", category_id, e)
         raise DatabaseError(
             f"Failed to get words for category '{category_id}': {e}"
         ) from e
@@ -1,11 +1,26 @@
+import hashlib
 import logging
+from collections import defaultdict
 
 from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
+from google.cloud.firestore_v1.field_path import FieldPath
 
-from utils import DatabaseError, timed_execution
+from utils import DatabaseError, DuplicateEntryError, timed_execution
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# Word document fields read into the Word model; list queries project onto
+# these so stray or legacy fields are never transferred or parsed.
+WORD_FIELD_PATHS = [
+    "user_id",
+    "word_text",
+    "word_text_search",
+    "word_stars",
+    "createdAt",
+    "updatedAt",
+]
+
 
 @timed_execution(logger, "Word Query")
 def _execute_word_query(
@@ -14,19 +29,27 @@ def _execute_word_query(
     additional_filters: list = None,  # List of tuples: [("field", "op", "value")]
     order_by_config: tuple = None,  # Tuple: ("field", "direction_constant_or_string")
     limit_count: int = None,
+    field_paths: list = None,  # Projection: only these fields are returned
+    convert=None,  # Optional callable applied to each snapshot as it streams in
 ):
     try:
-        # Log query parameters at DEBUG level
-        filter_desc = ", ".join(
-            [f"{f}:{op}:{v}" for f, op, v in (additional_filters or [])]
-        )
-        order_desc = (
-            f"{order_by_config[0]}:{order_by_config[1]}" if order_by_config else "none"
-        )
-        logger.debug(
-            f"DAL: Executing query on collection='words' with filters=[user_id={user_id}, {filter_desc}], "
-            f"ordering={order_desc}, limit={limit_count}"
-        )
+        # Log query parameters at DEBUG level; only build the descriptions when enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            filter_desc = ", ".join(
+                [f"{f}:{op}:{v}" for f, op, v in (additional_filters or [])]
+            )
+            order_desc = (
+                f"{order_by_config[0]}:{order_by_config[1]}"
+                if order_by_config
+                else "none"
+            )
+            logger.debug(
+                "DAL: Executing query on collection='words' with filters=[user_id=%s, %s], ordering=%s, limit=%s",
+                user_id,
+                filter_desc,
+                order_desc,
+                limit_count,
+            )
 
         query = db.collection("words").where(
             filter=firestore.FieldFilter("user_id", "==", user_id)
@@ -42,16 +65,27 @@ def _execute_word_query(
             query = query.order_by(field_path=sort_field, direction=sort_direction)
         if limit_count is not None and isinstance(limit_count, int) and limit_count > 0:
             query = query.limit(limit_count)
+        if field_paths:
+            query = query.select(field_paths)
 
-        snapshots = list(query.stream())
+        # Converting while streaming lets each snapshot be freed right away
+        # instead of holding every snapshot and every converted result at once
+        if convert:
+            results = [convert(snapshot) for snapshot in query.stream()]
+        else:
+            results = list(query.stream())
         # Log query results at DEBUG level
         logger.debug(
-            f"DAL: Query complete on collection='words' - found {len(snapshots)} documents for user {user_id}"
+            "DAL: Query complete on collection='words' - found %s documents for user %s",
+            len(results),
+            user_id,
         )
-        return snapshots
+        return results
     except Exception as e:
         logger.error(
-            f"DAL: Error in _execute_word_query for user {user_id}: {str(e)}",
+            "DAL: Error in _execute_word_query for user %s: %s",
+            user_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -68,8 +102,10 @@ def find_word_by_text_for_user(db, user_id: str, word_text: str):
         already exists for the specified user, primarily for duplicate prevention.
         Uses case-insensitive matching to prevent duplicates like "JavaScript" and "javascript".
     """
-    logger.info(
-        f"DAL: Finding word by text '{word_text}' for user {user_id} (case-insensitive)"
+    logger.debug(
+        "DAL: Finding word by text '%s' for user %s (case-insensitive)",
+        word_text,
+        user_id,
     )
 
     try:
@@ -82,6 +118,8 @@ def find_word_by_text_for_user(db, user_id: str, word_text: str):
             .where(
                 filter=firestore.FieldFilter("word_text_search", "==", word_text_lower)
             )
+            # Only the document id is needed, so project away every field
+            .select([FieldPath.document_id()])
             .limit(1)
         )
 
@@ -95,7 +133,10 @@ def find_word_by_text_for_user(db, user_id: str, word_text: str):
 
     except Exception as e:
         logger.error(
-            f"DAL: Error in case-insensitive word lookup for '{word_text}', user {user_id}: {str(e)}",
+            "DAL: Error in case-insensitive word lookup for '%s', user %s: %s",
+            word_text,
+            user_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -106,12 +147,12 @@ def find_word_by_text_for_user(db, user_id: str, word_text: str):
 def get_word_by_id(db, word_id):
     """Fetches a single word document from Firestore by its ID and returns Word model."""
     try:
-        logger.info(f"DAL: Attempting to fetch word by ID: '{word_id}'")
+        logger.debug("DAL: Attempting to fetch word by ID: '%s'", word_id)
         doc_ref = db.collection("words").document(word_id)
         snapshot = doc_ref.get()
 
         if not snapshot.exists:
-            logger.info(f"DAL: Word with ID '{word_id}' not found.")
+            logger.debug("DAL: Word with ID '%s' not found.", word_id)
             return None
 
         # Convert to Word model like category DAL does
@@ -128,41 +169,225 @@ def get_word_by_id(db, word_id):
 
     except Exception as e:
         logger.error(
-            f"DAL: Error fetching word by ID '{word_id}': {str(e)}", exc_info=True
+            "DAL: Error fetching word by ID '%s': %s", word_id, str(e), exc_info=True
         )
         raise DatabaseError(
             f"DAL: Firestore error fetching word by ID '{word_id}': {str(e)}"
         ) from e
 
 
-def update_word_by_id(db, word_id, new_word_text):
+def get_word_for_user(db, user_id: str, word_id: str):
+    """
+    Fetches a word owned by user_id as a Word model, or None if missing or not owned.
+
+    Ownership is filtered server-side, so another user's word is never
+    transferred. Descriptions and examples are not loaded; use load_word_entries.
+    """
+    try:
+        from models import Word
+
+        logger.debug("DAL: Fetching word '%s' for user %s", word_id, user_id)
+        query = (
+            db.collection("words")
+            .where(
+                filter=firestore.FieldFilter(
+                    FieldPath.document_id(),
+                    "==",
+                    db.collection("words").document(word_id),
+                )
+            )
+            .where(filter=firestore.FieldFilter("user_id", "==", user_id))
+            .limit(1)
+        )
+        for snapshot in query.stream():
+            word_data = snapshot.to_dict()
+            word_data["word_id"] = snapshot.id
+            return Word.model_validate(word_data)
+
+        logger.debug("DAL: Word '%s' not found for user %s.", word_id, user_id)
+        return None
+
+    except Exception as e:
+        logger.error(
+            "DAL: Error fetching word '%s' for user %s: %s",
+            word_id,
+            user_id,
+            str(e),
+            exc_info=True,
+        )
+        raise DatabaseError(
+            f"DAL: Firestore error fetching word '{word_id}' for user {user_id}: {str(e)}"
+        ) from e
+
+
+def get_words_by_ids(db, word_ids):
+    """
+    Fetches many word documents in one get_all round trip and returns Word models.
+
+    Results keep the order of word_ids and skip missing documents. Descriptions
+    and examples are not loaded; use load_word_entries for the words you keep.
+    """
+    try:
+        from models import Word
+
+        logger.debug("DAL: Fetching %s words by ID", len(word_ids))
+        refs = [db.collection("words").document(word_id) for word_id in word_ids]
+        words_by_id = {}
+        for snapshot in db.get_all(refs):
+            if snapshot.exists:
+                word_data = snapshot.to_dict()
+                word_data["word_id"] = snapshot.id
+                words_by_id[snapshot.id] = Word.model_validate(word_data)
+
+        return [words_by_id[word_id] for word_id in word_ids if word_id in words_by_id]
+
+    except Exception as e:
+        logger.error("DAL: Error fetching words by ID: %s", str(e), exc_info=True)
+        raise DatabaseError(
+            f"DAL: Firestore error fetching words by ID: {str(e)}"
+        ) from e
+
+
+def load_word_entries(db, word):
+    """Returns a copy of the Word model with its descriptions and examples loaded."""
+    return word.model_copy(
+        update={
+            "descriptions": get_all_descriptions_for_word(db, word.word_id),
+            "examples": get_all_examples_for_word(db, word.word_id),
+        }
+    )
+
+
+def get_word_summary(db, word_id: str):
+    """
+    Fetches only the user_id, word_text and word_text_search of a word as a dict,
+    or None if it does not exist.
+
+    Uses a field mask, so ownership checks don't transfer the whole word or
+    load its subcollections the way get_word_by_id does.
+    """
+    try:
+        logger.debug("DAL: Fetching owner of word '%s'", word_id)
+        snapshot = (
+            db.collection("words")
+            .document(word_id)
+            .get(field_paths=["user_id", "word_text", "word_text_search"])
+        )
+        if not snapshot.exists:
+            logger.debug("DAL: Word with ID '%s' not found.", word_id)
+            return None
+        return snapshot.to_dict()
+
+    except Exception as e:
+        logger.error(
+            "DAL: Error fetching owner of word '%s': %s", word_id, str(e), exc_info=True
+        )
+        raise DatabaseError(
+            f"DAL: Firestore error fetching owner of word '{word_id}': {str(e)}"
+        ) from e
+
+
+@firestore.transactional
+def _rename_word_if_unique(
+    transaction, db, word_ref, user_id: str, data_to_update: dict, old_index_ref
+):
+    """
+    Renames the word and moves its index entry unless another word holds the new text.
+
+    Returns the id of the conflicting word, or None once the writes are queued.
+    """
+    new_word_text_search = data_to_update["word_text_search"]
+    new_index_ref = _word_index_ref(db, user_id, new_word_text_search)
+    index_snapshot = new_index_ref.get(transaction=transaction)
+    if index_snapshot.exists and index_snapshot.get("word_id") != word_ref.id:
+        return index_snapshot.get("word_id")
+
+    # Words created before the index existed have no entry, so also check by text
+    legacy_query = (
+        db.collection("words")
+        .where(filter=firestore.FieldFilter("user_id", "==", user_id))
+        .where(
+            filter=firestore.FieldFilter("word_text_search", "==", new_word_text_search)
+        )
+        .select([FieldPath.document_id()])
+        .limit(2)
+    )
+    for snapshot in transaction.get(legacy_query):
+        if snapshot.id != word_ref.id:
+            return snapshot.id
+
+    transaction.update(word_ref, data_to_update)
+    transaction.delete(old_index_ref)
+    transaction.set(
+        new_index_ref,
+        {"word_id": word_ref.id, "word_text_search": new_word_text_search},
+    )
+    return None
+
+
+def update_word_by_id(
+    db, word_id, new_word_text, user_id: str, old_word_text_search: str
+):
     """
     Updates the 'word_text', 'word_text_search', and 'updatedAt' timestamp for a specific word document.
-    Returns True on success. Raises DatabaseError on failure.
+    When the search text changes, the duplicate check, the rename and the move of the
+    user's word_index entry share one transaction.
+    Returns the write's update time on success. Raises DuplicateEntryError (with
+    conflicting_id) if another of the user's words has the new text, DatabaseError on failure.
     """
     try:
         word_ref = db.collection("words").document(word_id)
+        new_word_text_search = new_word_text.lower()
         data_to_update = {
             "word_text": new_word_text,
-            "word_text_search": new_word_text.lower(),  # Update search field for case-insensitive searching
+            "word_text_search": new_word_text_search,  # Update search field for case-insensitive searching
             "updatedAt": firestore.SERVER_TIMESTAMP,
         }
-        word_ref.update(data_to_update)
-        logger.info(f"DAL: Updated word text for ID '{word_id}' to '{new_word_text}'")
-        return True
+        conflicting_id = None
+        if new_word_text_search == old_word_text_search:
+            # Case-only change: the index entry stays put, so a plain update will do
+            update_time = word_ref.update(data_to_update).update_time
+        else:
+            transaction = db.transaction()
+            conflicting_id = _rename_word_if_unique(
+                transaction,
+                db,
+                word_ref,
+                user_id,
+                data_to_update,
+                _word_index_ref(db, user_id, old_word_text_search),
+            )
+            update_time = transaction.commit_time
     except Exception as e:
         logger.error(
-            f"DAL: Error updating word text for ID '{word_id}' to '{new_word_text}': {str(e)}",
+            "DAL: Error updating word text for ID '%s' to '%s': %s",
+            word_id,
+            new_word_text,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
             f"DAL: Firestore error updating word text for ID '{word_id}' to '{new_word_text}': {str(e)}"
         ) from e
 
+    if conflicting_id:
+        logger.info(
+            "DAL: Word '%s' already exists for user %s (ID: %s)",
+            new_word_text_search,
+            user_id,
+            conflicting_id,
+        )
+        raise DuplicateEntryError(
+            "DAL: Word already exists for this user.", conflicting_id=conflicting_id
+        )
+
+    logger.info("DAL: Updated word text for ID '%s' to '%s'", word_id, new_word_text)
+    return update_time
 
-def delete_word_by_id(db, word_id: str):
+
+def delete_word_by_id(db, word_id: str, user_id: str, word_text_search: str):
     """
-    Deletes a word document from Firestore by its ID.
+    Deletes a word document from Firestore by its ID, along with its word_index entry.
     Returns True on success. Raises DatabaseError on failure.
     """
     try:
@@ -176,13 +401,16 @@ def delete_word_by_id(db, word_id: str):
         )
         [doc_snapshot.reference.delete() for doc_snapshot in desc_snapshots]
 
-        _ = db.collection("words").document(word_id).delete()
+        batch = db.batch()
+        batch.delete(db.collection("words").document(word_id))
+        batch.delete(_word_index_ref(db, user_id, word_text_search))
+        batch.commit()
 
-        logger.info(f"DAL: Successfully deleted word with ID '{word_id}'")
+        logger.info("DAL: Successfully deleted word with ID '%s'", word_id)
         return True
     except Exception as e:
         logger.error(
-            f"DAL: Error deleting word ID '{word_id}': {str(e)}", exc_info=True
+            "DAL: Error deleting word ID '%s': %s", word_id, str(e), exc_info=True
         )
         raise DatabaseError(
             f"DAL: Firestore error deleting word ID '{word_id}': {str(e)}"
@@ -191,65 +419,229 @@ def delete_word_by_id(db, word_id: str):
 
 def get_all_words_for_user_sorted_by_stars(db, user_id: str):
     """Gets all words for a user, sorted by word_stars descending, returns List[Word] models."""
-    logger.info(f"DAL: Getting all words for user {user_id}, sorted by word_stars")
+    logger.debug("DAL: Getting all words for user %s, sorted by word_stars", user_id)
     order_config = ("word_stars", "DESCENDING")
-    snapshots = _execute_word_query(db, user_id, order_by_config=order_config)
 
     # Convert snapshots to Word models like category DAL does
     from models import Word
 
-    word_models = []
+    # Two collection-group queries replace two subcollection reads per word
+    descriptions_by_word = get_all_descriptions_for_user(db, user_id)
+    examples_by_word = get_all_examples_for_user(db, user_id)
 
-    for snapshot in snapshots:
+    def to_word_model(snapshot):
         word_data = snapshot.to_dict()
         word_data["word_id"] = snapshot.id
 
-        # Fetch subcollections for complete Word model
-        word_data["descriptions"] = get_all_descriptions_for_word(db, snapshot.id)
-        word_data["examples"] = get_all_examples_for_word(db, snapshot.id)
+        # Attach subcollections for complete Word model
+        word_data["descriptions"] = descriptions_by_word.get(snapshot.id, [])
+        word_data["examples"] = examples_by_word.get(snapshot.id, [])
 
-        word_models.append(Word.model_validate(word_data))
+        return Word.model_validate(word_data)
+
+    word_models = _execute_word_query(
+        db,
+        user_id,
+        order_by_config=order_config,
+        field_paths=WORD_FIELD_PATHS,
+        convert=to_word_model,
+    )
 
-    logger.info(f"DAL: Converted {len(word_models)} Word models for user {user_id}")
+    logger.debug("DAL: Converted %s Word models for user %s", len(word_models), user_id)
     return word_models
 
 
-def add_word_to_db(db, data_to_save: dict):
+def _word_index_ref(db, user_id: str, word_text_search: str):
     """
-    Adds a new word document to Firestore.
-    Ensures word_text_search field is set for case-insensitive searching.
+    Returns the users/{uid}/word_index entry that reserves a word text for a user.
+
+    The id is a hash of word_text_search because word text may contain
+    characters that are not allowed in Firestore document ids.
+    """
+    index_id = hashlib.sha256(word_text_search.encode("utf-8")).hexdigest()
+    return (
+        db.collection("users")
+        .document(user_id)
+        .collection("word_index")
+        .document(index_id)
+    )
+
+
+@firestore.transactional
+def _create_word_if_unique(
+    transaction,
+    db,
+    index_ref,
+    word_ref,
+    description_ref,
+    example_ref,
+    word_data: dict,
+    description_data: dict,
+    example_data: dict,
+):
+    """
+    Writes the word, its initial entries and its index entry unless the text is taken.
+
+    Returns the id of the conflicting word, or None once the writes are queued.
+    """
+    index_snapshot = index_ref.get(transaction=transaction)
+    if index_snapshot.exists:
+        return index_snapshot.get("word_id")
+
+    # Words created before the index existed have no entry, so also check by text
+    legacy_query = (
+        db.collection("words")
+        .where(filter=firestore.FieldFilter("user_id", "==", word_data["user_id"]))
+        .where(
+            filter=firestore.FieldFilter(
+                "word_text_search", "==", word_data["word_text_search"]
+            )
+        )
+        .select([FieldPath.document_id()])
+        .limit(1)
+    )
+    for snapshot in transaction.get(legacy_query):
+        return snapshot.id
+
+    transaction.set(word_ref, word_data)
+    transaction.set(description_ref, {**description_data, "word_id": word_ref.id})
+    transaction.set(example_ref, {**example_data, "word_id": word_ref.id})
+    transaction.set(
+        index_ref,
+        {"word_id": word_ref.id, "word_text_search": word_data["word_text_search"]},
+    )
+    return None
+
+
+@timed_execution(logger, "Word Create Transaction")
+def create_word_transactional(
+    db, user_id: str, word_data: dict, description_data: dict, example_data: dict
+):
+    """
+    Adds a new word together with its initial description and example, atomically.
+
+    The duplicate check and all writes share one transaction keyed on the
+    users/{uid}/word_index entry, so two concurrent creates of the same text
+    cannot both succeed. Ensures word_text_search field is set for
+    case-insensitive searching.
+    Returns (commit_time, word_ref, description_ref, example_ref).
+    Raises DuplicateEntryError (with conflicting_id) if the user already has the word.
     """
     try:
         # Make sure word_text_search is set for case-insensitive searching
-        if "word_text" in data_to_save and "word_text_search" not in data_to_save:
-            data_to_save["word_text_search"] = data_to_save["word_text"].lower()
-
-        timestamp, doc_ref = db.collection("words").add(data_to_save)
-        logger.info(f"DAL: Word added to Firestore with ID: {doc_ref.id}")
-        return timestamp, doc_ref
+        if "word_text" in word_data and "word_text_search" not in word_data:
+            word_data["word_text_search"] = word_data["word_text"].lower()
+
+        word_ref = db.collection("words").document()
+        description_ref = word_ref.collection("descriptions").document()
+        example_ref = word_ref.collection("examples").document()
+        index_ref = _word_index_ref(db, user_id, word_data["word_text_search"])
+
+        transaction = db.transaction()
+        conflicting_id = _create_word_if_unique(
+            transaction,
+            db,
+            index_ref,
+            word_ref,
+            description_ref,
+            example_ref,
+            word_data,
+            description_data,
+            example_data,
+        )
     except Exception as e:
         logger.error(
-            f"DAL: Failed to add word data to Firestore: {str(e)}", exc_info=True
+            "DAL: Failed to add word data to Firestore: %s", str(e), exc_info=True
         )
         raise DatabaseError(f"DAL: Firestore error while adding word: {str(e)}") from e
 
+    if conflicting_id:
+        logger.info(
+            "DAL: Word '%s' already exists for user %s (ID: %s)",
+            word_data["word_text_search"],
+            user_id,
+            conflicting_id,
+        )
+        raise DuplicateEntryError(
+            "DAL: Word already exists for this user.", conflicting_id=conflicting_id
+        )
+
+    logger.info("DAL: Word added to Firestore with ID: %s", word_ref.id)
+    return transaction.commit_time, word_ref, description_ref, example_ref
+
+
+def _word_touch_batch(db, word_id: str):
+    """
+    Starts a WriteBatch that also bumps the parent word's updatedAt.
+
+    Subcollection writes go through this so the change and the parent
+    timestamp commit together in one round trip.
+    """
+    batch = db.batch()
+    batch.update(
+        db.collection("words").document(word_id),
+        {"updatedAt": firestore.SERVER_TIMESTAMP},
+    )
+    return batch
+
+
+@firestore.transactional
+def _update_if_owned(transaction, word_ref, doc_ref, user_id: str, updates: dict):
+    """
+    Applies updates to a word subdocument only if user_id owns it.
+
+    The ownership read, the update and the parent word's updatedAt bump share
+    one transaction. Returns the document's data from before the update, or
+    None if it does not exist or belongs to someone else.
+    """
+    snapshot = doc_ref.get(transaction=transaction)
+    if not snapshot.exists:
+        return None
+
+    data = snapshot.to_dict()
+    if data.get("user_id") != user_id:
+        return None
+
+    transaction.update(doc_ref, updates)
+    transaction.update(word_ref, {"updatedAt": firestore.SERVER_TIMESTAMP})
+    return data
+
+
+@firestore.transactional
+def _delete_if_owned(transaction, word_ref, doc_ref, user_id: str) -> bool:
+    """Deletes a word subdocument only if user_id owns it, bumping the word."""
+    snapshot = doc_ref.get(transaction=transaction)
+    if not snapshot.exists or snapshot.get("user_id") != user_id:
+        return False
+
+    transaction.delete(doc_ref)
+    transaction.update(word_ref, {"updatedAt": firestore.SERVER_TIMESTAMP})
+    return True
+
 
 def append_description_to_word_db(db, word_id: str, description_data: dict):
     """Adds a new description document to the specified word's 'descriptions' subcollection."""
     try:
-        _timestamp, new_description_ref = (
+        new_description_ref = (
             db.collection("words")
             .document(word_id)
             .collection("descriptions")
-            .add(description_data)
+            .document()
         )
+        batch = _word_touch_batch(db, word_id)
+        batch.set(new_description_ref, description_data)
+        batch.commit()
         logger.info(
-            f"DAL: New description added with ID {new_description_ref.id} to word '{word_id}'"
+            "DAL: New description added with ID %s to word '%s'",
+            new_description_ref.id,
+            word_id,
         )
         return new_description_ref
     except Exception as e:
         logger.error(
-            f"DAL: Failed to append description to word '{word_id}': {str(e)}",
+            "DAL: Failed to append description to word '%s': %s",
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -258,28 +650,46 @@ def append_description_to_word_db(db, word_id: str, description_data: dict):
 
 
 def update_description_to_word_db(
-    db, word_id: str, description_id: str, description_text: str
+    db, word_id: str, description_id: str, description_text: str, user_id: str
 ):
-    """Updates the description text and updatedAt timestamp for a specific description document."""
+    """
+    Updates the description text and updatedAt timestamp if user_id owns the description.
+
+    Returns the previous description text, or None if the description does not exist
+    or belongs to another user.
+    """
     try:
-        description_ref = (
-            db.collection("words")
-            .document(word_id)
-            .collection("descriptions")
-            .document(description_id)
-        )
+        word_ref = db.collection("words").document(word_id)
+        description_ref = word_ref.collection("descriptions").document(description_id)
         data_to_update = {
             "description_text": description_text,
             "updatedAt": firestore.SERVER_TIMESTAMP,
         }
-        description_ref.update(data_to_update)
+        previous_data = _update_if_owned(
+            db.transaction(), word_ref, description_ref, user_id, data_to_update
+        )
+        if previous_data is None:
+            logger.warning(
+                "DAL: Description '%s' in word '%s' not found for update by user '%s'.",
+                description_id,
+                word_id,
+                user_id,
+            )
+            return None
+
         logger.info(
-            f"DAL: Updated description text for ID '{description_id}' in word '{word_id}' to '{description_text}'"
+            "DAL: Updated description text for ID '%s' in word '%s' to '%s'",
+            description_id,
+            word_id,
+            description_text,
         )
-        return True
+        return previous_data.get("description_text")
     except Exception as e:
         logger.error(
-            f"DAL: Error updating description text for ID '{description_id}' in word '{word_id}': {str(e)}",
+            "DAL: Error updating description text for ID '%s' in word '%s': %s",
+            description_id,
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -287,26 +697,38 @@ def update_description_to_word_db(
         ) from e
 
 
-def delete_description_from_word_db(db, word_id: str, description_id: str):
+def delete_description_from_word_db(
+    db, word_id: str, description_id: str, user_id: str
+):
     """
-    Deletes a description document from a word's descriptions subcollection.
-    Returns True on success. Raises DatabaseError on failure.
+    Deletes a description document from a word's descriptions subcollection if user_id owns it.
+    Returns True on success, False if the description does not exist or belongs to another user.
+    Raises DatabaseError on failure.
     """
     try:
-        description_ref = (
-            db.collection("words")
-            .document(word_id)
-            .collection("descriptions")
-            .document(description_id)
-        )
-        description_ref.delete()
+        word_ref = db.collection("words").document(word_id)
+        description_ref = word_ref.collection("descriptions").document(description_id)
+        if not _delete_if_owned(db.transaction(), word_ref, description_ref, user_id):
+            logger.warning(
+                "DAL: Description '%s' in word '%s' not found for deletion by user '%s'.",
+                description_id,
+                word_id,
+                user_id,
+            )
+            return False
+
         logger.info(
-            f"DAL: Successfully deleted description with ID '{description_id}' from word '{word_id}'"
+            "DAL: Successfully deleted description with ID '%s' from word '%s'",
+            description_id,
+            word_id,
         )
         return True
     except Exception as e:
         logger.error(
-            f"DAL: Error deleting description ID '{description_id}' from word '{word_id}': {str(e)}",
+            "DAL: Error deleting description ID '%s' from word '%s': %s",
+            description_id,
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -317,8 +739,10 @@ def delete_description_from_word_db(db, word_id: str, description_id: str):
 def get_description_by_id(db, word_id: str, description_id: str):
     """Fetches a single description document and returns Description model or None."""
     try:
-        logger.info(
-            f"DAL: Attempting to fetch description by ID: '{description_id}' from word '{word_id}'"
+        logger.debug(
+            "DAL: Attempting to fetch description by ID: '%s' from word '%s'",
+            description_id,
+            word_id,
         )
         description_ref = (
             db.collection("words")
@@ -329,8 +753,10 @@ def get_description_by_id(db, word_id: str, description_id: str):
         snapshot = description_ref.get()
 
         if not snapshot.exists:
-            logger.info(
-                f"DAL: Description with ID '{description_id}' not found in word '{word_id}'."
+            logger.debug(
+                "DAL: Description with ID '%s' not found in word '%s'.",
+                description_id,
+                word_id,
             )
             return None
 
@@ -344,7 +770,10 @@ def get_description_by_id(db, word_id: str, description_id: str):
 
     except Exception as e:
         logger.error(
-            f"DAL: Error fetching description by ID '{description_id}' from word '{word_id}': {str(e)}",
+            "DAL: Error fetching description by ID '%s' from word '%s': %s",
+            description_id,
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -352,27 +781,47 @@ def get_description_by_id(db, word_id: str, description_id: str):
         ) from e
 
 
-def update_example_to_word_db(db, word_id: str, example_id: str, example_text: str):
-    """Updates the example text and updatedAt timestamp for a specific example document."""
+def update_example_to_word_db(
+    db, word_id: str, example_id: str, example_text: str, user_id: str
+):
+    """
+    Updates the example text and updatedAt timestamp if user_id owns the example.
+
+    Returns the previous example text, or None if the example does not exist
+    or belongs to another user.
+    """
     try:
-        example_ref = (
-            db.collection("words")
-            .document(word_id)
-            .collection("examples")
-            .document(example_id)
-        )
+        word_ref = db.collection("words").document(word_id)
+        example_ref = word_ref.collection("examples").document(example_id)
         data_to_update = {
             "example_text": example_text,
             "updatedAt": firestore.SERVER_TIMESTAMP,
         }
-        example_ref.update(data_to_update)
+        previous_data = _update_if_owned(
+            db.transaction(), word_ref, example_ref, user_id, data_to_update
+        )
+        if previous_data is None:
+            logger.warning(
+                "DAL: Example '%s' in word '%s' not found for update by user '%s'.",
+                example_id,
+                word_id,
+                user_id,
+            )
+            return None
+
         logger.info(
-            f"DAL: Updated example text for ID '{example_id}' in word '{word_id}' to '{example_text}'"
+            "DAL: Updated example text for ID '%s' in word '%s' to '%s'",
+            example_id,
+            word_id,
+            example_text,
         )
-        return True
+        return previous_data.get("example_text")
     except Exception as e:
         logger.error(
-            f"DAL: Error updating example text for ID '{example_id}' in word '{word_id}': {str(e)}",
+            "DAL: Error updating example text for ID '%s' in word '%s': %s",
+            example_id,
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -380,26 +829,36 @@ def update_example_to_word_db(db, word_id: str, example_id: str, example_text: s
         ) from e
 
 
-def delete_example_from_word_db(db, word_id: str, example_id: str):
+def delete_example_from_word_db(db, word_id: str, example_id: str, user_id: str):
     """
-    Deletes an example document from a word's examples subcollection.
-    Returns True on success. Raises DatabaseError on failure.
+    Deletes a example document from a word's examples subcollection if user_id owns it.
+    Returns True on success, False if the example does not exist or belongs to another user.
+    Raises DatabaseError on failure.
     """
     try:
-        example_ref = (
-            db.collection("words")
-            .document(word_id)
-            .collection("examples")
-            .document(example_id)
-        )
-        example_ref.delete()
+        word_ref = db.collection("words").document(word_id)
+        example_ref = word_ref.collection("examples").document(example_id)
+        if not _delete_if_owned(db.transaction(), word_ref, example_ref, user_id):
+            logger.warning(
+                "DAL: Example '%s' in word '%s' not found for deletion by user '%s'.",
+                example_id,
+                word_id,
+                user_id,
+            )
+            return False
+
         logger.info(
-            f"DAL: Successfully deleted example with ID '{example_id}' from word '{word_id}'"
+            "DAL: Successfully deleted example with ID '%s' from word '%s'",
+            example_id,
+            word_id,
         )
         return True
     except Exception as e:
         logger.error(
-            f"DAL: Error deleting example ID '{example_id}' from word '{word_id}': {str(e)}",
+            "DAL: Error deleting example ID '%s' from word '%s': %s",
+            example_id,
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -410,8 +869,10 @@ def delete_example_from_word_db(db, word_id: str, example_id: str):
 def get_example_by_id(db, word_id: str, example_id: str):
     """Fetches a single example document and returns Example model or None."""
     try:
-        logger.info(
-            f"DAL: Attempting to fetch example by ID: '{example_id}' from word '{word_id}'"
+        logger.debug(
+            "DAL: Attempting to fetch example by ID: '%s' from word '%s'",
+            example_id,
+            word_id,
         )
         example_ref = (
             db.collection("words")
@@ -422,8 +883,8 @@ def get_example_by_id(db, word_id: str, example_id: str):
         snapshot = example_ref.get()
 
         if not snapshot.exists:
-            logger.info(
-                f"DAL: Example with ID '{example_id}' not found in word '{word_id}'."
+            logger.debug(
+                "DAL: Example with ID '%s' not found in word '%s'.", example_id, word_id
             )
             return None
 
@@ -437,7 +898,10 @@ def get_example_by_id(db, word_id: str, example_id: str):
 
     except Exception as e:
         logger.error(
-            f"DAL: Error fetching example by ID '{example_id}' from word '{word_id}': {str(e)}",
+            "DAL: Error fetching example by ID '%s' from word '%s': %s",
+            example_id,
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -448,19 +912,23 @@ def get_example_by_id(db, word_id: str, example_id: str):
 def append_example_to_word_db(db, word_id: str, example_data: dict):
     """Adds a new example document to the specified word's 'examples' subcollection."""
     try:
-        _timestamp, new_example_ref = (
-            db.collection("words")
-            .document(word_id)
-            .collection("examples")
-            .add(example_data)
+        new_example_ref = (
+            db.collection("words").document(word_id).collection("examples").document()
         )
+        batch = _word_touch_batch(db, word_id)
+        batch.set(new_example_ref, example_data)
+        batch.commit()
         logger.info(
-            f"DAL: New example added with ID {new_example_ref.id} to word '{word_id}'"
+            "DAL: New example added with ID %s to word '%s'",
+            new_example_ref.id,
+            word_id,
         )
         return new_example_ref
     except Exception as e:
         logger.error(
-            f"DAL: Failed to append example to word '{word_id}': {str(e)}",
+            "DAL: Failed to append example to word '%s': %s",
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -488,13 +956,17 @@ def get_all_descriptions_for_word(db, word_id: str):
                 description_data["description_id"] = desc_snap.id
                 descriptions_list.append(Description.model_validate(description_data))
 
-        logger.info(
-            f"DAL: Retrieved {len(descriptions_list)} descriptions for word '{word_id}'"
+        logger.debug(
+            "DAL: Retrieved %s descriptions for word '%s'",
+            len(descriptions_list),
+            word_id,
         )
         return descriptions_list
     except Exception as e:
         logger.error(
-            f"DAL: Failed to get descriptions for word '{word_id}': {str(e)}",
+            "DAL: Failed to get descriptions for word '%s': %s",
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
@@ -520,31 +992,124 @@ def get_all_examples_for_word(db, word_id: str):
                 example_data["example_id"] = example_snap.id
                 examples_list.append(Example.model_validate(example_data))
 
-        logger.info(
-            f"DAL: Retrieved {len(examples_list)} examples for word '{word_id}'"
+        logger.debug(
+            "DAL: Retrieved %s examples for word '%s'", len(examples_list), word_id
         )
         return examples_list
     except Exception as e:
         logger.error(
-            f"DAL: Failed to get examples for word '{word_id}': {str(e)}", exc_info=True
+            "DAL: Failed to get examples for word '%s': %s",
+            word_id,
+            str(e),
+            exc_info=True,
         )
         raise DatabaseError(
             f"DAL: Could not retrieve examples for word '{word_id}' due to Firestore error: {str(e)}"
         ) from e
 
 
-@firestore.transactional
-@timed_execution(logger, "Word Star Transaction")
-def atomic_update(transaction, db, word_id, user_id):
+def _get_entries_for_user_by_word(
+    db, collection_id: str, id_field: str, model_cls, user_id: str
+):
+    """
+    Fetches every entry of one subcollection kind for a user with a single
+    collection-group query and returns {word_id: [model, ...]}.
+
+    Each word's entries are sorted by createdAt, like the per-word reads.
+    """
+    entries_by_word = defaultdict(list)
+    query = db.collection_group(collection_id).where(
+        filter=firestore.FieldFilter("user_id", "==", user_id)
+    )
+    for snapshot in query.stream():
+        entry_data = snapshot.to_dict()
+        entry_data[id_field] = snapshot.id
+        word_id = snapshot.reference.parent.parent.id
+        entries_by_word[word_id].append(model_cls.model_validate(entry_data))
+
+    for entries in entries_by_word.values():
+        entries.sort(
+            key=lambda entry: (entry.created_at is None, entry.created_at or 0)
+        )
+    return entries_by_word
+
+
+def get_all_descriptions_for_user(db, user_id: str):
+    """
+    Fetches all of a user's descriptions in one collection-group query.
+    Returns {word_id: List[Description]}.
+    """
     try:
+        from models import Description
+
+        descriptions_by_word = _get_entries_for_user_by_word(
+            db, "descriptions", "description_id", Description, user_id
+        )
         logger.debug(
-            f"DAL: Starting transaction for starring word '{word_id}' by user '{user_id}'"
+            "DAL: Retrieved descriptions for %s words of user %s",
+            len(descriptions_by_word),
+            user_id,
+        )
+        return descriptions_by_word
+    except Exception as e:
+        logger.error(
+            "DAL: Failed to get descriptions for user '%s': %s",
+            user_id,
+            str(e),
+            exc_info=True,
         )
-        # Read
+        raise DatabaseError(
+            f"DAL: Could not retrieve descriptions for user '{user_id}' due to Firestore error: {str(e)}"
+        ) from e
+
+
+def get_all_examples_for_user(db, user_id: str):
+    """
+    Fetches all of a user's examples in one collection-group query.
+    Returns {word_id: List[Example]}.
+    """
+    try:
+        from models import Example
+
+        examples_by_word = _get_entries_for_user_by_word(
+            db, "examples", "example_id", Example, user_id
+        )
+        logger.debug(
+            "DAL: Retrieved examples for %s words of user %s",
+            len(examples_by_word),
+            user_id,
+        )
+        return examples_by_word
+    except Exception as e:
+        logger.error(
+            "DAL: Failed to get examples for user '%s': %s",
+            user_id,
+            str(e),
+            exc_info=True,
+        )
+        raise DatabaseError(
+            f"DAL: Could not retrieve examples for user '{user_id}' due to Firestore error: {str(e)}"
+        ) from e
+
+
+@timed_execution(logger, "Word Star Increment")
+def increment_word_stars(db, word_id, user_id):
+    """
+    Adds one star to a word owned by user_id.
+
+    Returns "NOT_FOUND", "FORBIDDEN", or (new_star_count, word_text). A word's
+    owner never changes, so ownership is checked with a plain read of the two
+    needed fields. The increment itself is a server-side Increment transform,
+    which is atomic under concurrent stars without a transaction, and the
+    write result carries the post-increment count for the milestone checks.
+    """
+    try:
+        logger.debug("DAL: Starring word '%s' by user '%s'", word_id, user_id)
         word_doc_ref = db.collection("words").document(word_id)
-        snapshot = word_doc_ref.get(transaction=transaction)
+        snapshot = word_doc_ref.get(
+            field_paths=["user_id", "word_text", "word_text_search"]
+        )
 
-        # We add checks here since this *is* part of a transaction.
         if not snapshot.exists:
             return "NOT_FOUND"
 
@@ -553,23 +1118,28 @@ def atomic_update(transaction, db, word_id, user_id):
         if word_data.get("user_id") != user_id:
             return "FORBIDDEN"
 
-        word_text = word_data.get("word_text")
-
-        # Modify
-        current_stars = word_data.get("word_stars", 0)
-        new_star_count = current_stars + 1
+        updates = {
+            "word_stars": firestore.Increment(1),
+            "updatedAt": firestore.SERVER_TIMESTAMP,
+        }
+        try:
+            write_result = word_doc_ref.update(updates)
+        except NotFound:
+            # Deleted between the read and the increment.
+            return "NOT_FOUND"
 
-        # Write
-        transaction.update(
-            word_doc_ref,
-            {"word_stars": new_star_count, "updatedAt": firestore.SERVER_TIMESTAMP},
-        )
-        return (new_star_count, word_text)
+        # Transform results are returned in field-path order.
+        stars_index = sorted(updates).index("word_stars")
+        new_star_count = write_result.transform_results[stars_index].integer_value
+        return (new_star_count, word_data.get("word_text"))
     except Exception as e:
         logger.error(
-            f"DAL: Error starring words for user {user_id}, word '{word_text}': {str(e)}",
+            "DAL: Error starring word '%s' for user %s: %s",
+            word_id,
+            user_id,
+            str(e),
             exc_info=True,
         )
         raise DatabaseError(
-            f"DAL: Firestore error while querying words: {str(e)}"
+            f"DAL: Firestore error while starring word '{word_id}': {str(e)}"
         ) from e
@@ -15,15 +15,15 @@ class CategoryFactory:
     @staticmethod
     def create_from_schema(schema: CategoryCreateSchema, user_id: str) -> Category:
         """Create Category from validated schema with business rules applied."""
-        logger.info(
-            f"FACTORY: Creating new category model from schema for user: {user_id}"
+        logger.debug(
+            "FACTORY: Creating new category model from schema for user: %s", user_id
         )
         normalized_name = CategoryFactory._normalize_category_name(schema.category_name)
         validated_color = CategoryFactory._validate_color_format(schema.category_color)
 
         return Category(
             category_name=normalized_name,
-            category_name_search=normalized_name.lower(),  # Lowercase version for searching
+            category_name_search=CategoryFactory._to_search_name(normalized_name),
             category_color=validated_color,
             user_id=user_id,
         )
@@ -38,17 +38,18 @@ class CategoryFactory:
                 schema.category_name
             )
             updates["category_name"] = normalized_name
-            updates["category_name_search"] = (
-                normalized_name.lower()
-            )  # Lowercase version for searching
+            updates["category_name_search"] = CategoryFactory._to_search_name(
+                normalized_name
+            )
 
         if schema.category_color is not None:
             updates["category_color"] = CategoryFactory._validate_color_format(
                 schema.category_color
             )
 
-        logger.info(
-            f"FACTORY: Created category update dictionary with keys: {list(updates.keys())}"
+        logger.debug(
+            "FACTORY: Created category update dictionary with keys: %s",
+            list(updates.keys()),
         )
         return updates
 
@@ -57,6 +58,16 @@ class CategoryFactory:
         """Normalize category name by trimming whitespace, preserving original capitalization."""
         return name.strip()
 
+    @staticmethod
+    def _to_search_name(normalized_name: str) -> str:
+        """
+        Canonical lowercase form stored in category_name_search.
+
+        This is the single place names are case-normalized; duplicate checks
+        compare these persisted values instead of lowercasing at runtime.
+        """
+        return normalized_name.lower()
+
     @staticmethod
     def _validate_color_format(color: str) -> str:
         """Business rule: validate hex color format (6 characters)."""
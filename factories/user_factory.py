@@ -15,11 +15,11 @@ class UserFactory:
     @staticmethod
     def create_from_schema(schema: UserCreateSchema, user_id: str) -> User:
         """Create a new User model from a validated schema."""
-        logger.info(f"FACTORY: Creating new user model for user_id: {user_id}")
+        logger.debug("FACTORY: Creating new user model for user_id: %s", user_id)
         # Business Rule: A new user must be assigned a unique 8-character code.
         user_code = generate_random_code(8)
-        logger.info(
-            f"FACTORY: Generated user_code '{user_code}' for user_id: {user_id}"
+        logger.debug(
+            "FACTORY: Generated user_code '%s' for user_id: %s", user_code, user_id
         )
 
         # Construct the User model with all necessary initial data.
@@ -36,8 +36,8 @@ class UserFactory:
         # This creates a dictionary containing only the fields that were
         # actually provided in the request, filtering out the `None` values.
         updates = schema.model_dump(exclude_unset=True)
-        logger.info(
-            f"FACTORY: Created update dictionary with keys: {list(updates.keys())}"
+        logger.debug(
+            "FACTORY: Created update dictionary with keys: %s", list(updates.keys())
         )
 
         return updates
@@ -15,6 +15,10 @@ from schemas import (
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# Star counts that prompt the user to add another description / example
+DESCRIPTION_MILESTONES = frozenset({5, 10, 15, 20})
+EXAMPLE_MILESTONES = frozenset({10, 20, 30, 40})
+
 
 class WordFactory:
     """Factory for creating Word objects with business rules and validation"""
@@ -28,7 +32,9 @@ class WordFactory:
         - New words start with 0 stars
         - Word text preserves user's original capitalization
         """
-        logger.info(f"FACTORY: Creating new word model from schema for user: {user_id}")
+        logger.debug(
+            "FACTORY: Creating new word model from schema for user: %s", user_id
+        )
 
         return Word(
             word_text=schema.word_text,  # Preserve original capitalization
@@ -42,8 +48,8 @@ class WordFactory:
         schema: DescriptionCreateSchema, user_id: str, is_initial: bool = False
     ) -> Description:
         """Create Description model from validated schema"""
-        logger.info(
-            f"FACTORY: Creating description model from schema for user: {user_id}"
+        logger.debug(
+            "FACTORY: Creating description model from schema for user: %s", user_id
         )
 
         return Description(
@@ -57,7 +63,9 @@ class WordFactory:
         schema: ExampleCreateSchema, user_id: str, is_initial: bool = False
     ) -> Example:
         """Create Example model from validated schema"""
-        logger.info(f"FACTORY: Creating example model from schema for user: {user_id}")
+        logger.debug(
+            "FACTORY: Creating example model from schema for user: %s", user_id
+        )
 
         return Example(
             example_text=schema.example_text,
@@ -73,8 +81,9 @@ class WordFactory:
             "word_text_search": schema.word_text.lower(),  # Lowercase version for searching
         }
 
-        logger.info(
-            f"FACTORY: Created word update dictionary with keys: {list(updates.keys())}"
+        logger.debug(
+            "FACTORY: Created word update dictionary with keys: %s",
+            list(updates.keys()),
         )
         return updates
 
@@ -85,7 +94,7 @@ class WordFactory:
             "description_text": schema.description_text,
         }
 
-        logger.info(f"FACTORY: Created description update dictionary")
+        logger.debug("FACTORY: Created description update dictionary")
         return updates
 
     @staticmethod
@@ -95,7 +104,7 @@ class WordFactory:
             "example_text": schema.example_text,
         }
 
-        logger.info(f"FACTORY: Created example update dictionary")
+        logger.debug("FACTORY: Created example update dictionary")
         return updates
 
     @staticmethod
@@ -110,16 +119,15 @@ class WordFactory:
         Returns:
             dict: {"prompt_for_description": bool, "prompt_for_example": bool}
         """
-        description_milestones = [5, 10, 15, 20]
-        example_milestones = [10, 20, 30, 40]
-
-        prompt_for_description = star_count in description_milestones
-        prompt_for_example = star_count in example_milestones
+        prompt_for_description = star_count in DESCRIPTION_MILESTONES
+        prompt_for_example = star_count in EXAMPLE_MILESTONES
 
         if prompt_for_description or prompt_for_example:
             logger.info(
-                f"FACTORY: Star milestone reached at {star_count} stars - "
-                f"description: {prompt_for_description}, example: {prompt_for_example}"
+                "FACTORY: Star milestone reached at %s stars - description: %s, example: %s",
+                star_count,
+                prompt_for_description,
+                prompt_for_example,
             )
 
         return {
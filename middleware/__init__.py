@@ -3,6 +3,7 @@
 from .firebase_auth_check import (
     admin_required,
     firebase_token_required,
+    get_request_admin_ids,
     resolve_user_by_code,
     super_admin_required,
 )
@@ -12,4 +13,5 @@ __all__ = [
     "admin_required",
     "super_admin_required",
     "resolve_user_by_code",
+    "get_request_admin_ids",
 ]
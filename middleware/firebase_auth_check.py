@@ -2,9 +2,15 @@
 
 import logging
 from functools import wraps
+from typing import Optional
 
-from firebase_admin import auth, firestore
+from firebase_admin import auth
 from flask import g, jsonify, request
+from google.cloud.firestore_v1.field_path import FieldPath
+
+from data_access import admin_dal as a_dal
+from data_access import firestore_pool
+from utils import DatabaseError, cached_for_request
 
 logger = logging.getLogger("infinite_vocab_app")
 
@@ -22,11 +28,11 @@ def firebase_token_required():
         id_token = auth_header.split("Bearer ")[1]
         decoded_token = auth.verify_id_token(id_token)
         g.user_id = decoded_token["uid"]
-        g.db = firestore.client()
-        logger.info(f"AUTH: Token verified for user_id: {g.user_id}")
+        g.db = firestore_pool.get_client()
+        logger.info("AUTH: Token verified for user_id: %s", g.user_id)
 
     except Exception as e:
-        logger.error(f"AUTH: Error verifying Firebase ID token: {e}", exc_info=True)
+        logger.error("AUTH: Error verifying Firebase ID token: %s", e, exc_info=True)
         return jsonify({"error": "Invalid or expired authentication token"}), 401
 
 
@@ -44,20 +50,27 @@ def admin_required(f):
             return jsonify({"error": "Authentication token is required."}), 401
 
         try:
-            admin_doc = g.db.collection("admins").document(g.user_id).get()
+            # Only the role is read, so fetch just that field.
+            admin_doc = (
+                g.db.collection("admins").document(g.user_id).get(field_paths=["role"])
+            )
             if not admin_doc.exists:
                 logger.warning(
-                    f"AUTH: Admin check failed - User {g.user_id} is not an admin."
+                    "AUTH: Admin check failed - User %s is not an admin.", g.user_id
                 )
                 return jsonify(
                     {"error": "Forbidden: Admin privileges are required."}
                 ), 403
 
             g.admin_role = admin_doc.to_dict().get("role", "admin")
-            logger.info(f"AUTH: User {g.user_id} is an admin with role: {g.admin_role}")
+            logger.info(
+                "AUTH: User %s is an admin with role: %s", g.user_id, g.admin_role
+            )
         except Exception as e:
             logger.error(
-                f"AUTH: DB error checking admin status for user {g.user_id}: {e}",
+                "AUTH: DB error checking admin status for user %s: %s",
+                g.user_id,
+                e,
                 exc_info=True,
             )
             return jsonify(
@@ -85,7 +98,9 @@ def super_admin_required(f):
 
         if g.admin_role != "super-admin":
             logger.warning(
-                f"AUTH: Super admin check failed - User {g.user_id} has role '{g.admin_role}', but 'super-admin' is required."
+                "AUTH: Super admin check failed - User %s has role '%s', but 'super-admin' is required.",
+                g.user_id,
+                g.admin_role,
             )
             return jsonify(
                 {
@@ -93,7 +108,7 @@ def super_admin_required(f):
                 }
             ), 403
 
-        logger.info(f"AUTH: User {g.user_id} verified as super-admin.")
+        logger.info("AUTH: User %s verified as super-admin.", g.user_id)
         return f(*args, **kwargs)
 
     return decorated_function
@@ -119,19 +134,27 @@ def resolve_user_by_code(param_name: str):
             if not user_code:
                 # This is a developer configuration error.
                 logger.error(
-                    f"DEV_ERROR: `resolve_user_by_code` decorator used with invalid param_name '{param_name}'.",
+                    "DEV_ERROR: `resolve_user_by_code` decorator used with invalid param_name '%s'.",
+                    param_name,
                     exc_info=True,
                 )
                 return jsonify({"error": "Server configuration error."}), 500
 
             try:
                 users_ref = g.db.collection("users")
-                query = users_ref.where("user_code", "==", user_code).limit(1)
+                # Only the matching document's ID is used.
+                query = (
+                    users_ref.where("user_code", "==", user_code)
+                    .select([FieldPath.document_id()])
+                    .limit(1)
+                )
                 docs = list(query.stream())
 
                 if not docs:
                     logger.warning(
-                        f"AUTH: User with code '{user_code}' not found by admin {g.user_id}."
+                        "AUTH: User with code '%s' not found by admin %s.",
+                        user_code,
+                        g.user_id,
                     )
                     return jsonify(
                         {"error": f"User with code '{user_code}' not found."}
@@ -144,7 +167,10 @@ def resolve_user_by_code(param_name: str):
 
             except Exception as e:
                 logger.error(
-                    f"DB_ERROR: Failed lookup for user_code '{user_code}' by admin {g.user_id}: {e}",
+                    "DB_ERROR: Failed lookup for user_code '%s' by admin %s: %s",
+                    user_code,
+                    g.user_id,
+                    e,
                     exc_info=True,
                 )
                 return jsonify(
@@ -156,3 +182,19 @@ def resolve_user_by_code(param_name: str):
         return decorated_function
 
     return decorator
+
+
+def get_request_admin_ids() -> Optional[frozenset]:
+    """
+    Returns the frozenset of admin user IDs, fetched at most once per request.
+
+    The result is kept in the request cache so every service call made while
+    handling the same request shares a single lookup. On a database error this
+    returns None, letting the service fetch the set itself and apply its own
+    error handling.
+    """
+    try:
+        return cached_for_request(("admin_ids",), lambda: a_dal.get_all_admin_ids(g.db))
+    except DatabaseError as e:
+        logger.error("AUTH: Failed to load admin IDs for request: %s", e)
+        return None
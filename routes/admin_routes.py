@@ -1,18 +1,26 @@
 """Admin routes - Endpoints for administrative tasks."""
 
+import itertools
 import logging
 
-from flask import Blueprint, g, jsonify, request
+from flask import Blueprint, Response, g, jsonify, request, stream_with_context
 
 from middleware import (
     admin_required,
     firebase_token_required,
+    get_request_admin_ids,
     resolve_user_by_code,
     super_admin_required,
 )
 from schemas import RoleUpdateSchema, ScoreUpdateSchema
 from services import admin_service
-from utils import AdminServiceError, DuplicateEntryError, NotFoundError, ValidationError
+from utils import (
+    AdminServiceError,
+    DuplicateEntryError,
+    NotFoundError,
+    ValidationError,
+    stream_json_array,
+)
 
 logger = logging.getLogger("infinite_vocab_app")
 admin_bp = Blueprint("admin_api", __name__, url_prefix="/api/v1/admin")
@@ -33,11 +41,19 @@ def list_all_users_route():
     """Endpoint for an admin to get a list of all users. Accessible by: admin, super-admin"""
     logger.info(f"ROUTE: Admin {g.user_id} requesting to list all users.")
     try:
-        all_users = admin_service.get_all_users(g.db)
-        logger.info(
-            f"ROUTE: Successfully retrieved {len(all_users)} users for admin {g.user_id}."
+        all_users = admin_service.get_all_users(g.db, admin_ids=get_request_admin_ids())
+        # Pull the first user before the 200 goes out, so a failing query still
+        # maps to a 500 instead of a truncated streamed body
+        first_user = next(all_users, None)
+        if first_user is not None:
+            all_users = itertools.chain((first_user,), all_users)
+        logger.info(f"ROUTE: Streaming all users to admin {g.user_id}.")
+        user_dicts = (user.model_dump(by_alias=True) for user in all_users)
+        return Response(
+            stream_with_context(stream_json_array(user_dicts)),
+            status=200,
+            mimetype="application/json",
         )
-        return jsonify([user.model_dump(by_alias=True) for user in all_users]), 200
 
     except AdminServiceError as e:
         logger.error(f"ROUTE: Service error for admin {g.user_id} listing users: {e}")
@@ -59,7 +75,10 @@ def promote_user_route(user_code_to_promote: str):
         current_admin_id = g.user_id
 
         result = admin_service.add_admin_privileges(
-            g.db, user_id_to_promote, current_admin_id
+            g.db,
+            user_id_to_promote,
+            current_admin_id,
+            admin_ids=get_request_admin_ids(),
         )
         logger.info(
             f"ROUTE: Super-admin {g.user_id} successfully promoted user {user_id_to_promote}."
@@ -94,7 +113,9 @@ def update_role_route(user_code: str):
     )
     try:
         schema = RoleUpdateSchema(**request.get_json())
-        result = admin_service.update_admin_role(g.db, user_id, schema)
+        result = admin_service.update_admin_role(
+            g.db, user_id, schema, admin_ids=get_request_admin_ids()
+        )
         logger.info(
             f"ROUTE: Super-admin {g.user_id} successfully updated role for user {user_id}."
         )
@@ -129,7 +150,9 @@ def demote_user_route(user_code_to_demote: str):
     )
 
     try:
-        result = admin_service.remove_admin_privileges(g.db, user_id_to_demote)
+        result = admin_service.remove_admin_privileges(
+            g.db, user_id_to_demote, admin_ids=get_request_admin_ids()
+        )
         logger.info(
             f"ROUTE: Super-admin {g.user_id} successfully demoted user {user_id_to_demote}."
         )
@@ -5,6 +5,13 @@ from .category_schema import CategoryCreateSchema, CategoryUpdateSchema
 from .score_update_schema import ScoreUpdateSchema
 from .user_schema import UserCreateSchema, UserUpdateSchema
 from .word_schemas import (
+    DESCRIPTION_CREATE_ADAPTER,
+    DESCRIPTION_UPDATE_ADAPTER,
+    EXAMPLE_CREATE_ADAPTER,
+    EXAMPLE_UPDATE_ADAPTER,
+    WORD_CREATE_ADAPTER,
+    WORD_EXISTENCE_CHECK_ADAPTER,
+    WORD_UPDATE_ADAPTER,
     WordCreateSchema,
     WordUpdateSchema,
     WordExistenceCheckSchema,
@@ -28,4 +35,12 @@ __all__ = [
     "DescriptionUpdateSchema",
     "ExampleCreateSchema",
     "ExampleUpdateSchema",
+    # Pre-built validators for the word schemas
+    "WORD_CREATE_ADAPTER",
+    "WORD_UPDATE_ADAPTER",
+    "WORD_EXISTENCE_CHECK_ADAPTER",
+    "DESCRIPTION_CREATE_ADAPTER",
+    "DESCRIPTION_UPDATE_ADAPTER",
+    "EXAMPLE_CREATE_ADAPTER",
+    "EXAMPLE_UPDATE_ADAPTER",
 ]
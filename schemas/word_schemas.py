@@ -1,5 +1,4 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class WordCreateSchema(BaseModel):
@@ -172,3 +171,14 @@ class ExampleUpdateSchema(BaseModel):
             "description": "Schema for updating an existing example",
             "example": {"exampleText": "Please explain this topic in detail"},
         }
+
+
+# Module-level adapters, built once at import time. Validating raw request
+# dicts through these reuses the compiled core schema on every call.
+WORD_CREATE_ADAPTER = TypeAdapter(WordCreateSchema)
+WORD_UPDATE_ADAPTER = TypeAdapter(WordUpdateSchema)
+WORD_EXISTENCE_CHECK_ADAPTER = TypeAdapter(WordExistenceCheckSchema)
+DESCRIPTION_CREATE_ADAPTER = TypeAdapter(DescriptionCreateSchema)
+DESCRIPTION_UPDATE_ADAPTER = TypeAdapter(DescriptionUpdateSchema)
+EXAMPLE_CREATE_ADAPTER = TypeAdapter(ExampleCreateSchema)
+EXAMPLE_UPDATE_ADAPTER = TypeAdapter(ExampleUpdateSchema)
@@ -1,7 +1,7 @@
 """Admin Service - business logic for admin-only operations."""
 
 import logging
-from typing import List, Optional
+from typing import Iterator, Optional
 
 from data_access import admin_dal as a_dal
 from data_access import admin_student_dal as as_dal
@@ -9,40 +9,62 @@ from data_access import score_history_dal as sh_dal
 from data_access import user_dal as u_dal
 from models import User
 from schemas import RoleUpdateSchema, ScoreUpdateSchema
+from services.user_service import invalidate_signed_in_user
 from utils import AdminServiceError, DatabaseError, DuplicateEntryError, NotFoundError
 
 logger = logging.getLogger("infinite_vocab_app")
 
 
-def get_all_users(db):
-    """Retrieves a list of all users, enriching each with their admin status."""
-    logger.info("SERVICE: get_all_users invoked.")
+def get_all_users(db, admin_ids: Optional[frozenset] = None) -> Iterator[User]:
+    """
+    Streams all users, enriching each with their admin status.
+
+    The admin ID set is fetched eagerly so that failures surface before the
+    caller starts streaming; users are then yielded one at a time.
+    """
+    logger.debug("SERVICE: get_all_users invoked.")
     try:
-        admin_ids = a_dal.get_all_admin_ids(db)
-        all_users = u_dal.list_all_users(db)
-        logger.info(
-            f"SERVICE: Found {len(all_users)} total users and {len(admin_ids)} admins."
-        )
-        for user in all_users:
+        if admin_ids is None:
+            admin_ids = a_dal.get_all_admin_ids(db)
+    except DatabaseError as e:
+        logger.error("SERVICE: DatabaseError in get_all_users: %s", e)
+        raise AdminServiceError("Failed to retrieve all users from database.") from e
+
+    logger.info("SERVICE: Streaming all users against %s admins.", len(admin_ids))
+    return _enrich_users_with_admin_status(u_dal.stream_all_users(db), admin_ids)
+
+
+def _enrich_users_with_admin_status(users, admin_ids) -> Iterator[User]:
+    """Flags admins as users pass through, without materializing the list."""
+    try:
+        for user in users:
             if user.user_id in admin_ids:
                 user.is_admin = True
-        return all_users
+            yield user
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError in get_all_users: {e}")
+        logger.error("SERVICE: DatabaseError while streaming all users: %s", e)
         raise AdminServiceError("Failed to retrieve all users from database.") from e
 
 
-def add_admin_privileges(db, user_id_to_promote: str, current_admin_id: str):
+def add_admin_privileges(
+    db,
+    user_id_to_promote: str,
+    current_admin_id: str,
+    admin_ids: Optional[frozenset] = None,
+):
     """Promotes a regular user to an admin."""
     logger.info(
-        f"SERVICE: Admin {current_admin_id} attempting to promote {user_id_to_promote}."
+        "SERVICE: Admin %s attempting to promote %s.",
+        current_admin_id,
+        user_id_to_promote,
     )
     try:
         user_to_promote = u_dal.get_user_by_id(db, user_id_to_promote)
         if not user_to_promote:
             raise NotFoundError(f"User with ID '{user_id_to_promote}' not found.")
 
-        admin_ids = a_dal.get_all_admin_ids(db)
+        if admin_ids is None:
+            admin_ids = a_dal.get_all_admin_ids(db)
         if user_id_to_promote in admin_ids:
             raise DuplicateEntryError(
                 f"User '{user_to_promote.user_name}' is already an admin."
@@ -50,93 +72,99 @@ def add_admin_privileges(db, user_id_to_promote: str, current_admin_id: str):
 
         a_dal.promote_user_to_admin(db, user_id_to_promote, current_admin_id)
         logger.info(
-            f"SERVICE: User {user_id_to_promote} successfully promoted by {current_admin_id}."
+            "SERVICE: User %s successfully promoted by %s.",
+            user_id_to_promote,
+            current_admin_id,
         )
         return {
             "message": f"User '{user_to_promote.user_name}' has been promoted to admin."
         }
-    except (NotFoundError, DuplicateEntryError) as e:
-        logger.warning(
-            f"SERVICE: Pre-condition failed for admin {current_admin_id} promoting {user_id_to_promote}: {e}"
-        )
-        raise
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError promoting {user_id_to_promote}: {e}")
+        logger.error("SERVICE: DatabaseError promoting %s: %s", user_id_to_promote, e)
         raise AdminServiceError("A database error occurred during promotion.") from e
 
 
-def update_admin_role(db, user_id_to_update: str, schema: RoleUpdateSchema):
+def update_admin_role(
+    db,
+    user_id_to_update: str,
+    schema: RoleUpdateSchema,
+    admin_ids: Optional[frozenset] = None,
+):
     """Updates the role for a user who is already an admin."""
     logger.info(
-        f"SERVICE: Attempting to update role for admin {user_id_to_update} to '{schema.role}'."
+        "SERVICE: Attempting to update role for admin %s to '%s'.",
+        user_id_to_update,
+        schema.role,
     )
     try:
-        admin_ids = a_dal.get_all_admin_ids(db)
+        if admin_ids is None:
+            admin_ids = a_dal.get_all_admin_ids(db)
         if user_id_to_update not in admin_ids:
             raise NotFoundError("Cannot update role: User is not an admin.")
 
         a_dal.update_admin_role(db, user_id_to_update, schema.role)
         logger.info(
-            f"SERVICE: Successfully updated role for admin {user_id_to_update}."
+            "SERVICE: Successfully updated role for admin %s.", user_id_to_update
         )
         return {"message": f"Admin role updated to '{schema.role}'."}
-    except NotFoundError as e:
-        logger.warning(
-            f"SERVICE: Attempt to update role for non-admin user {user_id_to_update} failed: {e}"
-        )
-        raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError updating role for admin {user_id_to_update}: {e}"
+            "SERVICE: DatabaseError updating role for admin %s: %s",
+            user_id_to_update,
+            e,
         )
         raise AdminServiceError("A database error occurred while updating role.") from e
 
 
-def remove_admin_privileges(db, user_id_to_demote: str):
+def remove_admin_privileges(
+    db, user_id_to_demote: str, admin_ids: Optional[frozenset] = None
+):
     """Demotes an admin back to a regular user."""
-    logger.info(f"SERVICE: Attempting to demote admin {user_id_to_demote}.")
+    logger.info("SERVICE: Attempting to demote admin %s.", user_id_to_demote)
     try:
         user_to_demote = u_dal.get_user_by_id(db, user_id_to_demote)
-        admin_ids = a_dal.get_all_admin_ids(db)
+        if admin_ids is None:
+            admin_ids = a_dal.get_all_admin_ids(db)
         if user_id_to_demote not in admin_ids:
             raise NotFoundError("Cannot demote: User is not an admin.")
 
         a_dal.demote_admin(db, user_id_to_demote)
-        logger.info(f"SERVICE: Successfully demoted admin {user_id_to_demote}.")
+        logger.info("SERVICE: Successfully demoted admin %s.", user_id_to_demote)
 
         return {
             "message": f"Admin '{user_to_demote.user_name}' privileges have been revoked."
         }
-    except NotFoundError as e:
-        logger.warning(
-            f"SERVICE: Attempt to demote non-admin user {user_id_to_demote} failed: {e}"
-        )
-        raise
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError demoting admin {user_id_to_demote}: {e}")
+        logger.error(
+            "SERVICE: DatabaseError demoting admin %s: %s", user_id_to_demote, e
+        )
         raise AdminServiceError("A database error occurred during demotion.") from e
 
 
 def assign_student_to_admin(db, admin_id: str, student_id_to_assign: str) -> dict:
     """Assigns a student to the requesting admin, enforcing business rules."""
     logger.info(
-        f"SERVICE: Admin {admin_id} attempting to assign student {student_id_to_assign}."
+        "SERVICE: Admin %s attempting to assign student %s.",
+        admin_id,
+        student_id_to_assign,
     )
     try:
+        # Fetch all precondition data up front in a single DAL call.
+        student, is_admin, existing_link = as_dal.validate_assignment(
+            db, student_id_to_assign
+        )
+
         # Rule 1: Ensure the student exists as a user.
-        student = u_dal.get_user_by_id(db, student_id_to_assign)
         if not student:
             raise NotFoundError(
                 f"User with ID '{student_id_to_assign}' does not exist."
             )
 
         # Rule 2: Ensure the user being assigned is not another admin.
-        all_admin_ids = a_dal.get_all_admin_ids(db)
-        if student_id_to_assign in all_admin_ids:
+        if is_admin:
             raise DuplicateEntryError("Cannot assign an admin as a student.")
 
         # Rule 3: Ensure the student is not already assigned to another admin.
-        existing_link = as_dal.get_link_by_student_id(db, student_id_to_assign)
         if existing_link:
             if existing_link.get("admin_id") == admin_id:
                 raise DuplicateEntryError(
@@ -151,18 +179,18 @@ def assign_student_to_admin(db, admin_id: str, student_id_to_assign: str) -> dic
 
         as_dal.create_link(db, admin_id, student_id_to_assign)
         logger.info(
-            f"SERVICE: Successfully assigned student {student_id_to_assign} to admin {admin_id}."
+            "SERVICE: Successfully assigned student %s to admin %s.",
+            student_id_to_assign,
+            admin_id,
         )
         return {"message": f"Successfully assigned student '{student.user_name}'."}
 
-    except (NotFoundError, DuplicateEntryError) as e:
-        logger.warning(
-            f"SERVICE: Pre-condition failed for admin {admin_id} assigning student {student_id_to_assign}: {e}"
-        )
-        raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError assigning student {student_id_to_assign} to admin {admin_id}: {e}"
+            "SERVICE: DatabaseError assigning student %s to admin %s: %s",
+            student_id_to_assign,
+            admin_id,
+            e,
         )
         raise AdminServiceError(
             "A database error occurred while assigning the student."
@@ -172,7 +200,9 @@ def assign_student_to_admin(db, admin_id: str, student_id_to_assign: str) -> dic
 def remove_student_from_admin(db, admin_id: str, student_id_to_remove: str) -> dict:
     """Removes a student from an admin's management, checking ownership."""
     logger.info(
-        f"SERVICE: Admin {admin_id} attempting to remove student {student_id_to_remove}."
+        "SERVICE: Admin %s attempting to remove student %s.",
+        admin_id,
+        student_id_to_remove,
     )
     try:
         # Check if the student is currently assigned to this admin.
@@ -183,28 +213,28 @@ def remove_student_from_admin(db, admin_id: str, student_id_to_remove: str) -> d
         # If the link exists and is correct, remove it.
         as_dal.remove_link(db, admin_id, student_id_to_remove)
         logger.info(
-            f"SERVICE: Successfully removed student {student_id_to_remove} from admin {admin_id}."
+            "SERVICE: Successfully removed student %s from admin %s.",
+            student_id_to_remove,
+            admin_id,
         )
 
         return {"message": "Successfully removed student."}
 
-    except NotFoundError as e:
-        logger.warning(
-            f"SERVICE: NotFound error for admin {admin_id} removing student {student_id_to_remove}: {e}"
-        )
-        raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError removing student {student_id_to_remove} from admin {admin_id}: {e}"
+            "SERVICE: DatabaseError removing student %s from admin %s: %s",
+            student_id_to_remove,
+            admin_id,
+            e,
         )
         raise AdminServiceError(
             "A database error occurred while removing the student."
         ) from e
 
 
-def list_students_for_admin(db, admin_id: str) -> List[User]:
+def list_students_for_admin(db, admin_id: str) -> list[User]:
     """Lists all students assigned to the currently logged-in admin."""
-    logger.info(f"SERVICE: Listing students for admin {admin_id}.")
+    logger.debug("SERVICE: Listing students for admin %s.", admin_id)
     try:
         student_ids = as_dal.get_students_for_admin(db, admin_id)
         if not student_ids:
@@ -219,7 +249,7 @@ def list_students_for_admin(db, admin_id: str) -> List[User]:
 
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError listing students for admin {admin_id}: {e}"
+            "SERVICE: DatabaseError listing students for admin %s: %s", admin_id, e
         )
         raise AdminServiceError(
             "A database error occurred while listing students."
@@ -228,11 +258,11 @@ def list_students_for_admin(db, admin_id: str) -> List[User]:
 
 def find_user_by_code(db, user_code: str) -> Optional[User]:
     """Finds a single user by their user_code."""
-    logger.info(f"SERVICE: Finding user by code: {user_code}")
+    logger.debug("SERVICE: Finding user by code: %s", user_code)
     try:
         return u_dal.get_user_by_code(db, user_code)
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError finding user by code {user_code}: {e}")
+        logger.error("SERVICE: DatabaseError finding user by code %s: %s", user_code, e)
         raise AdminServiceError(
             "A database error occurred while finding the user."
         ) from e
@@ -240,7 +270,7 @@ def find_user_by_code(db, user_code: str) -> Optional[User]:
 
 def add_assessment_score(db, admin_id: str, student_id: str, schema: ScoreUpdateSchema):
     """Adds a score to a student, updates their total, and logs the history."""
-    logger.info(f"SERVICE: Admin {admin_id} adding score to student {student_id}.")
+    logger.info("SERVICE: Admin %s adding score to student %s.", admin_id, student_id)
     try:
         # Rule 1: Verify the student exists and is assigned to this admin.
         link = as_dal.get_link_by_student_id(db, student_id)
@@ -259,6 +289,7 @@ def add_assessment_score(db, admin_id: str, student_id: str, schema: ScoreUpdate
         # Rule 3: Calculate new score and perform the update.
         new_total_score = student.total_score + schema.score_change
         u_dal.update_user(db, student_id, {"total_score": new_total_score})
+        invalidate_signed_in_user(student_id)
 
         # Rule 4: Create the history log.
         history_entry = {
@@ -271,18 +302,19 @@ def add_assessment_score(db, admin_id: str, student_id: str, schema: ScoreUpdate
         sh_dal.create_score_history_entry(db, history_entry)
 
         logger.info(
-            f"SERVICE: Successfully added {schema.score_change} to student {student_id}. New total: {new_total_score}."
+            "SERVICE: Successfully added %s to student %s. New total: %s.",
+            schema.score_change,
+            student_id,
+            new_total_score,
         )
         return {
             "message": "Score updated successfully.",
             "newTotalScore": new_total_score,
         }
 
-    except NotFoundError:
-        raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError adding score to student {student_id}: {e}"
+            "SERVICE: DatabaseError adding score to student %s: %s", student_id, e
         )
         raise AdminServiceError(
             "A database error occurred while adding the score."
@@ -7,35 +7,59 @@ from data_access import category_dal as c_dal
 from factories import CategoryFactory
 from models import Category
 from schemas import CategoryCreateSchema, CategoryUpdateSchema
-from utils import CategoryServiceError, DatabaseError, NotFoundError
+from services.search_service import invalidate_search_cache
+from utils import (
+    CategoryServiceError,
+    DatabaseError,
+    NotFoundError,
+    cached_for_request,
+    invalidate_request_cache,
+)
 
 logger = logging.getLogger("infinite_vocab_app")
 
 
+def _categories_cache_key(user_id: str) -> tuple:
+    """Request-cache key for a user's category list."""
+    return ("categories", user_id)
+
+
+def _category_cache_key(category_id: str) -> tuple:
+    """Request-cache key for a single category, shared with word_category_service."""
+    return ("category", category_id)
+
+
 def create_category(db, user_id: str, schema: CategoryCreateSchema) -> Category:
     """Creates a new category for a user with duplicate validation"""
-    logger.info(
-        f"SERVICE: create_category invoked for user '{user_id}' with name '{schema.category_name}'."
+    logger.debug(
+        "SERVICE: create_category invoked for user '%s' with name '%s'.",
+        user_id,
+        schema.category_name,
     )
     try:
-        existing_categories = c_dal.get_categories_by_user(db, user_id)
-        normalized_name = schema.category_name.strip()
-
-        for existing_category in existing_categories:
-            if existing_category.category_name.lower() == normalized_name.lower():
-                raise CategoryServiceError(
-                    f"Category '{schema.category_name}' already exists for this user."
-                )
-
         partial_category = CategoryFactory.create_from_schema(schema, user_id)
+        duplicate = c_dal.get_category_by_name_for_user(
+            db, user_id, partial_category.category_name_search
+        )
+        if duplicate:
+            raise CategoryServiceError(
+                f"Category '{schema.category_name}' already exists for this user."
+            )
+
         created_category = c_dal.create_category(db, partial_category)
+        invalidate_request_cache(_categories_cache_key(user_id))
+        invalidate_search_cache(user_id)
         logger.info(
-            f"SERVICE: Successfully created category '{created_category.category_id}' for user '{user_id}'."
+            "SERVICE: Successfully created category '%s' for user '%s'.",
+            created_category.category_id,
+            user_id,
         )
         return created_category
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during category creation for user '{user_id}': {e}",
+            "SERVICE: DatabaseError during category creation for user '%s': %s",
+            user_id,
+            e,
             exc_info=True,
         )
         raise CategoryServiceError(
@@ -43,7 +67,9 @@ def create_category(db, user_id: str, schema: CategoryCreateSchema) -> Category:
         ) from e
     except Exception as e:
         logger.error(
-            f"SERVICE: Unexpected error during category creation for user '{user_id}': {e}",
+            "SERVICE: Unexpected error during category creation for user '%s': %s",
+            user_id,
+            e,
             exc_info=True,
         )
         raise
@@ -51,13 +77,18 @@ def create_category(db, user_id: str, schema: CategoryCreateSchema) -> Category:
 
 def get_categories_by_user(db, user_id: str) -> List[Category]:
     """Retrieves all categories for a user, sorted alphabetically"""
-    logger.info(f"SERVICE: get_categories_by_user invoked for user '{user_id}'.")
+    logger.debug("SERVICE: get_categories_by_user invoked for user '%s'.", user_id)
     try:
-        categories = c_dal.get_categories_by_user(db, user_id)
+        categories = cached_for_request(
+            _categories_cache_key(user_id),
+            lambda: c_dal.get_categories_by_user(db, user_id),
+        )
         return categories
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during category retrieval for user '{user_id}': {e}",
+            "SERVICE: DatabaseError during category retrieval for user '%s': %s",
+            user_id,
+            e,
             exc_info=True,
         )
         raise CategoryServiceError(
@@ -67,22 +98,32 @@ def get_categories_by_user(db, user_id: str) -> List[Category]:
 
 def get_category_by_id(db, category_id: str, user_id: str) -> Category:
     """Retrieves a category by ID with user ownership validation"""
-    logger.info(
-        f"SERVICE: get_category_by_id invoked for cat '{category_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: get_category_by_id invoked for cat '%s' by user '%s'.",
+        category_id,
+        user_id,
     )
     try:
-        category = c_dal.get_category_by_id(db, category_id)
+        category = cached_for_request(
+            _category_cache_key(category_id),
+            lambda: c_dal.get_category_by_id(db, category_id),
+        )
         if not category:
             raise NotFoundError(f"Category with ID '{category_id}' not found.")
         if category.user_id != user_id:
             logger.warning(
-                f"SERVICE: Ownership check failed for cat '{category_id}'. Requester: '{user_id}', Owner: '{category.user_id}'."
+                "SERVICE: Ownership check failed for cat '%s'. Requester: '%s', Owner: '%s'.",
+                category_id,
+                user_id,
+                category.user_id,
             )
             raise NotFoundError(f"Category with ID '{category_id}' not found.")
         return category
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during get_category_by_id for '{category_id}': {e}",
+            "SERVICE: DatabaseError during get_category_by_id for '%s': %s",
+            category_id,
+            e,
             exc_info=True,
         )
         raise CategoryServiceError(
@@ -94,36 +135,48 @@ def update_category(
     db, category_id: str, user_id: str, schema: CategoryUpdateSchema
 ) -> Category:
     """Updates a category with user validation and duplicate checking"""
-    logger.info(
-        f"SERVICE: update_category invoked for cat '{category_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: update_category invoked for cat '%s' by user '%s'.",
+        category_id,
+        user_id,
     )
     try:
         existing_category = get_category_by_id(db, category_id, user_id)
         updates = CategoryFactory.create_update_dict(schema)
+        # Drop fields that already hold the requested value; if nothing is left
+        # the PATCH is a no-op and needs neither a duplicate check nor a write.
+        updates = {
+            field: value
+            for field, value in updates.items()
+            if getattr(existing_category, field) != value
+        }
         if not updates:
             return existing_category
 
-        if "category_name" in updates:
-            new_name = updates["category_name"]
-            if new_name.lower() != existing_category.category_name.lower():
-                user_categories = c_dal.get_categories_by_user(db, user_id)
-                for cat in user_categories:
-                    if (
-                        cat.category_id != category_id
-                        and cat.category_name.lower() == new_name.lower()
-                    ):
-                        raise CategoryServiceError(
-                            f"Category '{updates['category_name']}' already exists."
-                        )
+        # Only a change to the search name can collide with another category;
+        # a case-only rename keeps the same search name and skips the check.
+        if "category_name_search" in updates:
+            duplicate = c_dal.get_category_by_name_for_user(
+                db, user_id, updates["category_name_search"]
+            )
+            if duplicate and duplicate.category_id != category_id:
+                raise CategoryServiceError(
+                    f"Category '{updates['category_name']}' already exists."
+                )
 
         updated_category = c_dal.update_category(db, category_id, updates)
-        logger.info(f"SERVICE: Successfully updated category '{category_id}'.")
+        invalidate_request_cache(_categories_cache_key(user_id))
+        invalidate_request_cache(_category_cache_key(category_id))
+        invalidate_search_cache(user_id)
+        logger.info("SERVICE: Successfully updated category '%s'.", category_id)
         return updated_category
     except (NotFoundError, CategoryServiceError):
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during category update for '{category_id}': {e}",
+            "SERVICE: DatabaseError during category update for '%s': %s",
+            category_id,
+            e,
             exc_info=True,
         )
         raise CategoryServiceError(
@@ -133,21 +186,25 @@ def update_category(
 
 def delete_category(db, category_id: str, user_id: str) -> None:
     """Deletes a category with user ownership validation"""
-    logger.info(
-        f"SERVICE: delete_category invoked for cat '{category_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: delete_category invoked for cat '%s' by user '%s'.",
+        category_id,
+        user_id,
     )
     try:
-        get_category_by_id(db, category_id, user_id)
-        deleted = c_dal.delete_category(db, category_id)
+        deleted = c_dal.delete_category(db, category_id, user_id)
+        invalidate_request_cache(_categories_cache_key(user_id))
+        invalidate_request_cache(_category_cache_key(category_id))
+        invalidate_search_cache(user_id)
         if not deleted:
-            raise NotFoundError(
-                f"Category with ID '{category_id}' not found for deletion."
-            )
+            raise NotFoundError(f"Category with ID '{category_id}' not found.")
     except (NotFoundError, CategoryServiceError):
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during category deletion for '{category_id}': {e}",
+            "SERVICE: DatabaseError during category deletion for '%s': %s",
+            category_id,
+            e,
             exc_info=True,
         )
         raise CategoryServiceError(
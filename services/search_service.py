@@ -1,7 +1,12 @@
 """Service layer for handling search operations."""
 
+import itertools
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from cachetools import TTLCache
 from google.cloud.firestore_v1.client import Client
 
 from data_access import search_dal
@@ -14,32 +19,90 @@ from utils import DatabaseError, SearchServiceError
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# The word and category searches are independent network-bound queries, so
+# they run side by side on a small shared pool instead of back to back. Size
+# the pool to the server's request concurrency with SEARCH_MAX_WORKERS.
+SEARCH_MAX_WORKERS = int(os.environ.get("SEARCH_MAX_WORKERS", 4))
+_search_executor = ThreadPoolExecutor(
+    max_workers=SEARCH_MAX_WORKERS, thread_name_prefix="search"
+)
+
+# Typeahead searches repeat the same terms constantly, so results are cached
+# briefly per (user, normalized query). Each user also has a version number
+# that is part of the key; bumping it on any word/category write makes all of
+# that user's cached results unreachable without scanning the cache.
+# Versions come from one process-wide counter, so they never repeat, and they
+# expire with the same TTL as the results: once a user's version has expired,
+# every result cached before their last write has expired too, and falling
+# back to version 0 cannot serve a stale entry.
+SEARCH_CACHE_TTL_SECONDS = 30
+_search_cache = TTLCache(maxsize=4096, ttl=SEARCH_CACHE_TTL_SECONDS)
+_search_versions = TTLCache(maxsize=65536, ttl=SEARCH_CACHE_TTL_SECONDS)
+_search_version_counter = itertools.count(1)
+_search_cache_lock = threading.Lock()
+
+
+def invalidate_search_cache(user_id: str) -> None:
+    """Invalidates every cached search result for a user after a write."""
+    with _search_cache_lock:
+        _search_versions[user_id] = next(_search_version_counter)
+
 
 def find_words_and_categories(db: Client, user_id: str, query: str) -> SearchResults:
     """
     Finds words and categories matching a query and returns them in a structured model.
     """
-    logger.info(
-        f"SERVICE: find_words_and_categories invoked for user '{user_id}' with query '{query}'."
+    logger.debug(
+        "SERVICE: find_words_and_categories invoked for user '%s' with query '%s'.",
+        user_id,
+        query,
     )
+    with _search_cache_lock:
+        cache_key = (user_id, _search_versions.get(user_id, 0), query.strip().lower())
+        cached_results = _search_cache.get(cache_key)
+    if cached_results is not None:
+        logger.debug("SERVICE: Returning cached search results for user '%s'.", user_id)
+        return cached_results
+
     try:
-        word_docs = search_dal.search_words_by_name(db, user_id, query)
-        category_docs = search_dal.search_categories_by_name(db, user_id, query)
-        logger.info(
-            f"SERVICE: DAL found {len(word_docs)} words and {len(category_docs)} categories."
+        words_future = _search_executor.submit(
+            search_dal.search_words_by_name, db, user_id, query
+        )
+        categories_future = _search_executor.submit(
+            search_dal.search_categories_by_name, db, user_id, query
+        )
+        word_docs = words_future.result()
+        category_docs = categories_future.result()
+        logger.debug(
+            "SERVICE: DAL found %s words and %s categories.",
+            len(word_docs),
+            len(category_docs),
         )
 
+        # Rows come straight from our own collections, so they are built with
+        # model_construct (no validation) and only the displayed field is read.
         word_results = [
-            WordSearchResult.model_validate(doc.to_dict() | {"word_id": doc.id})
+            WordSearchResult.model_construct(
+                word_id=doc.id, word_text=doc.get("word_text")
+            )
             for doc in word_docs
         ]
         category_results = [
-            CategorySearchResult.model_validate(doc.to_dict() | {"category_id": doc.id})
+            CategorySearchResult.model_construct(
+                category_id=doc.id, category_name=doc.get("category_name")
+            )
             for doc in category_docs
         ]
 
-        return SearchResults(words=word_results, categories=category_results)
+        results = SearchResults.model_construct(
+            words=word_results, categories=category_results
+        )
+        with _search_cache_lock:
+            _search_cache[cache_key] = results
+        return results
 
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError during search for user '{user_id}': {e}")
+        logger.error(
+            "SERVICE: DatabaseError during search for user '%s': %s", user_id, e
+        )
         raise SearchServiceError("A database error occurred during the search.") from e
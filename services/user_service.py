@@ -1,103 +1,169 @@
 """User Service - business logic for user operations."""
 
 import logging
+import os
+import threading
 from typing import List
 
+from cachetools import TTLCache
+
 from data_access import admin_dal as a_dal
 from data_access import score_history_dal as sh_dal
 from data_access import user_dal as u_dal
 from factories import UserFactory
 from models import ScoreHistoryEntry, User
 from schemas import UserCreateSchema, UserUpdateSchema
-from utils import DatabaseError, NotFoundError, UserServiceError, generate_random_code
+from utils import (
+    DatabaseError,
+    DuplicateEntryError,
+    NotFoundError,
+    UserServiceError,
+    cached_for_request,
+    generate_random_code,
+)
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# Clients call the sign-in endpoint repeatedly during a session, and the
+# result only changes when the profile or score is written. Signed-in users
+# are cached briefly per process; writes made through this process drop the
+# entry, and the TTL (SIGN_IN_CACHE_TTL, seconds) bounds staleness from
+# writes made elsewhere.
+SIGN_IN_CACHE_TTL_SECONDS = float(os.environ.get("SIGN_IN_CACHE_TTL", 30))
+_sign_in_cache = TTLCache(maxsize=4096, ttl=SIGN_IN_CACHE_TTL_SECONDS)
+_sign_in_cache_lock = threading.Lock()
+
+
+def invalidate_signed_in_user(user_id: str) -> None:
+    """Drops a user's cached sign-in result after their document changes."""
+    with _sign_in_cache_lock:
+        _sign_in_cache.pop(user_id, None)
+
 
 def get_or_create_user(db, user_id: str, schema: UserCreateSchema) -> tuple[User, bool]:
     """
     Retrieves a user if they exist, otherwise creates a new one.
     If an existing user is missing a user_code, it will be generated and saved.
+    Concurrent first sign-ins for the same user create exactly one document.
     """
-    logger.info(f"SERVICE: get_or_create_user invoked for user_id: {user_id}.")
+    logger.debug("SERVICE: get_or_create_user invoked for user_id: %s.", user_id)
+    with _sign_in_cache_lock:
+        cached_user = _sign_in_cache.get(user_id)
+    if cached_user is not None:
+        logger.debug("SERVICE: Returning cached sign-in for user '%s'.", user_id)
+        return cached_user.model_copy(), False
+
+    user, was_created = _get_or_create_user_from_db(db, user_id, schema)
+    if user is not None:
+        with _sign_in_cache_lock:
+            _sign_in_cache[user_id] = user.model_copy()
+    return user, was_created
+
+
+def _get_or_create_user_from_db(
+    db, user_id: str, schema: UserCreateSchema
+) -> tuple[User, bool]:
+    """Reads, backfills or creates the user document behind get_or_create_user."""
     try:
         existing_user = u_dal.get_user_by_id(db, user_id)
         if existing_user:
-            logger.info(f"SERVICE: Found existing user with ID '{user_id}'.")
+            logger.debug("SERVICE: Found existing user with ID '%s'.", user_id)
 
             # If the user exists but is missing a code, generate and save one.
             if not existing_user.user_code:
                 logger.warning(
-                    f"SERVICE: User {user_id} is missing a user_code. Generating a new one."
+                    "SERVICE: User %s is missing a user_code. Generating a new one.",
+                    user_id,
+                )
+                updated_user = u_dal.ensure_user_code(
+                    db, user_id, generate_random_code()
                 )
-                new_code = generate_random_code()
-                updated_user = u_dal.update_user(db, user_id, {"user_code": new_code})
                 return updated_user, False  # Return updated user, was_created = False
 
             return existing_user, False  # Return original user, was_created = False
 
-        logger.info(f"SERVICE: No user found for ID '{user_id}'. Creating new user.")
+        logger.info("SERVICE: No user found for ID '%s'. Creating new user.", user_id)
         new_user_model = UserFactory.create_from_schema(schema, user_id)
-        created_user = u_dal.create_user(db, new_user_model)
+        try:
+            created_user = u_dal.create_user(db, new_user_model)
+        except DuplicateEntryError:
+            # A concurrent sign-in created the document between our read and
+            # write; its create won, so return that user instead of overwriting.
+            logger.info(
+                "SERVICE: User '%s' was created concurrently. Using existing user.",
+                user_id,
+            )
+            return u_dal.get_user_by_id(db, user_id), False
         return created_user, True
 
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError in get_or_create_user for {user_id}: {e}")
+        logger.error(
+            "SERVICE: DatabaseError in get_or_create_user for %s: %s", user_id, e
+        )
         raise UserServiceError("Database operation failed.") from e
 
 
 def get_user_profile(db, user_id: str) -> User:
     """Retrieves a user's profile by their ID."""
 
-    logger.info(f"SERVICE: get_user_profile invoked for user_id: {user_id}.")
+    logger.debug("SERVICE: get_user_profile invoked for user_id: %s.", user_id)
     try:
         user = u_dal.get_user_by_id(db, user_id)
-        admin_ids = a_dal.get_all_admin_ids(db)
-        if user.user_id in admin_ids:
-            user.is_admin = True
         if not user:
             raise NotFoundError(f"User with ID '{user_id}' not found.")
 
+        # Only look up admin status once we know the user exists.
+        admin_ids = cached_for_request(
+            ("admin_ids",), lambda: a_dal.get_all_admin_ids(db)
+        )
+        if user.user_id in admin_ids:
+            user.is_admin = True
+
         return user
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError in get_user_profile for {user_id}: {e}")
+        logger.error(
+            "SERVICE: DatabaseError in get_user_profile for %s: %s", user_id, e
+        )
         raise UserServiceError("Failed to retrieve user profile.") from e
 
 
 def update_user_profile(db, user_id: str, schema: UserUpdateSchema) -> User:
     """Updates a user's profile information."""
 
-    logger.info(f"SERVICE: update_user_profile invoked for user_id: {user_id}.")
+    logger.debug("SERVICE: update_user_profile invoked for user_id: %s.", user_id)
     try:
         updates = UserFactory.create_update_dict(schema)
         if not updates:
+            # No-op PATCH: a single user read; admin status comes from the cache.
             logger.info(
-                f"SERVICE: No fields to update for user {user_id}. Returning current profile."
+                "SERVICE: No fields to update for user %s. Returning current profile.",
+                user_id,
             )
             return get_user_profile(db, user_id)
 
         updated_user = u_dal.update_user(db, user_id, updates)
+        invalidate_signed_in_user(user_id)
         if not updated_user:
             raise NotFoundError(f"User with ID '{user_id}' not found for update.")
 
-        logger.info(f"SERVICE: Successfully updated profile for user {user_id}.")
+        logger.info("SERVICE: Successfully updated profile for user %s.", user_id)
         return updated_user
-    except (DatabaseError, NotFoundError) as e:
-        logger.error(f"SERVICE: Error updating profile for user {user_id}: {e}")
+    except DatabaseError as e:
+        logger.error("SERVICE: Error updating profile for user %s: %s", user_id, e)
         raise UserServiceError("Failed to update user profile.") from e
 
 
 def get_score_history_for_user(db, user_id: str) -> List[ScoreHistoryEntry]:
     """Retrieves the score history for a specific user."""
-    logger.info(f"SERVICE: Getting score history for user {user_id}.")
+    logger.debug("SERVICE: Getting score history for user %s.", user_id)
     try:
         history_data = sh_dal.get_history_for_user(db, user_id)
-        # Convert the list of dictionaries from the DAL into a list of Pydantic models
-
-        return [ScoreHistoryEntry.model_validate(entry) for entry in history_data]
+        # Entries are written only by add_assessment_score, so the DAL dicts are
+        # already schema-shaped; model_construct skips re-validating each row.
+        return [ScoreHistoryEntry.model_construct(**entry) for entry in history_data]
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError getting score history for user {user_id}: {e}"
+            "SERVICE: DatabaseError getting score history for user %s: %s", user_id, e
         )
         raise UserServiceError(
             "A database error occurred while retrieving score history."
@@ -105,12 +171,19 @@ def get_score_history_for_user(db, user_id: str) -> List[ScoreHistoryEntry]:
 
 
 def get_leaderboard(db, limit: int = 20) -> List[User]:
-    """Retrieves the top users for the leaderboard."""
-    logger.info("SERVICE: get_leaderboard invoked.")
+    """Retrieves the top non-admin users for the leaderboard."""
+    logger.debug("SERVICE: get_leaderboard invoked.")
     try:
-        return u_dal.get_users_for_leaderboard(db, limit)
+        # One (cached) admin-set lookup covers every row. Over-fetch by the
+        # number of admins so filtering them out still leaves `limit` users.
+        admin_ids = cached_for_request(
+            ("admin_ids",), lambda: a_dal.get_all_admin_ids(db)
+        )
+        users = u_dal.get_users_for_leaderboard(db, limit + len(admin_ids))
+        leaderboard = [user for user in users if user.user_id not in admin_ids]
+        return leaderboard[:limit]
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError getting leaderboard: {e}")
+        logger.error("SERVICE: DatabaseError getting leaderboard: %s", e)
         raise UserServiceError(
             "A database error occurred while retrieving the leaderboard."
         ) from e
@@ -17,6 +17,7 @@ Each service follows the same clean patterns as category_service.py.
 from .word_service import (
     create_word_for_user,
     get_word_details_for_user,
+    verify_word_ownership,
     update_word_for_user,
     delete_word_for_user,
     list_words_for_user,
@@ -45,6 +46,7 @@ __all__ = [
     # Core word operations
     "create_word_for_user",
     "get_word_details_for_user",
+    "verify_word_ownership",
     "update_word_for_user",
     "delete_word_for_user",
     "list_words_for_user",
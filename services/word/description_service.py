@@ -4,39 +4,13 @@ import logging
 
 from data_access import word_dal as w_dal
 from factories import WordFactory
-from models import Description
 from schemas import DescriptionCreateSchema, DescriptionUpdateSchema
 from utils import DatabaseError, NotFoundError, WordServiceError
 from firebase_admin import firestore
 
-logger = logging.getLogger("infinite_vocab_app")
-
+from .word_service import invalidate_cached_word, verify_word_ownership
 
-def _get_description_by_id_with_ownership(
-    db, user_id: str, word_id: str, description_id: str
-) -> Description:
-    """Helper to get description with ownership validation - like get_category_by_id pattern"""
-    # First verify word ownership using word service
-    from .word_service import get_word_details_for_user
-
-    get_word_details_for_user(db, user_id, word_id)  # This handles word ownership
-
-    # Then get the description
-    description = w_dal.get_description_by_id(
-        db, word_id, description_id
-    )  # DAL returns Description model now!
-    if not description:
-        raise NotFoundError(
-            f"Description with ID '{description_id}' not found in word '{word_id}'."
-        )
-    if description.user_id != user_id:  # Simple property access like category
-        logger.warning(
-            f"SERVICE: Ownership check failed for description '{description_id}'. Requester: '{user_id}', Owner: '{description.user_id}'."
-        )
-        raise NotFoundError(
-            f"Description with ID '{description_id}' not found or not accessible."
-        )
-    return description
+logger = logging.getLogger("infinite_vocab_app")
 
 
 def add_description_for_user(
@@ -47,16 +21,14 @@ def add_description_for_user(
     initial_description: bool = False,
 ) -> dict:
     """Adds a description to a word - like create_category pattern"""
-    logger.info(
-        f"SERVICE: add_description_for_user invoked for word '{word_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: add_description_for_user invoked for word '%s' by user '%s'.",
+        word_id,
+        user_id,
     )
     try:
-        # Verify word ownership first (reuse word service)
-        from .word_service import get_word_details_for_user
-
-        get_word_details_for_user(
-            db, user_id, word_id
-        )  # This handles ownership validation
+        # Verify word ownership first (reads only the word's user_id)
+        verify_word_ownership(db, user_id, word_id)
 
         # Create description model using factory - like category
         description_model = WordFactory.create_description_from_schema(
@@ -69,7 +41,6 @@ def add_description_for_user(
             "word_id": word_id,
             "is_initial": description_model.is_initial,
             "createdAt": firestore.SERVER_TIMESTAMP,
-            "updatedAt": firestore.SERVER_TIMESTAMP,
             "user_id": description_model.user_id,
         }
 
@@ -78,9 +49,12 @@ def add_description_for_user(
             db, word_id, description_data
         )
         new_description_id = new_description_ref.id
+        invalidate_cached_word(user_id, word_id)
 
         logger.info(
-            f"SERVICE: Successfully added description to word '{word_id}' for user '{user_id}'."
+            "SERVICE: Successfully added description to word '%s' for user '%s'.",
+            word_id,
+            user_id,
         )
         return {
             "message": f"Description added successfully to word '{word_id}'.",
@@ -92,7 +66,9 @@ def add_description_for_user(
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during description creation for word '{word_id}': {e}",
+            "SERVICE: DatabaseError during description creation for word '%s': %s",
+            word_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -100,7 +76,9 @@ def add_description_for_user(
         ) from e
     except Exception as e:
         logger.error(
-            f"SERVICE: Unexpected error during description creation for word '{word_id}': {e}",
+            "SERVICE: Unexpected error during description creation for word '%s': %s",
+            word_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -112,24 +90,26 @@ def update_description_for_user(
     db, user_id: str, word_id: str, description_id: str, description_text: str
 ) -> dict:
     """Updates a description - like update_category pattern"""
-    logger.info(
-        f"SERVICE: update_description_for_user invoked for description '{description_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: update_description_for_user invoked for description '%s' by user '%s'.",
+        description_id,
+        user_id,
     )
     try:
-        # Get existing description with ownership validation (reuse helper)
-        existing_description = _get_description_by_id_with_ownership(
-            db, user_id, word_id, description_id
-        )
-
-        old_description_text = existing_description.description_text
-
-        # Update the description using DAL
-        w_dal.update_description_to_word_db(
-            db, word_id, description_id, description_text
+        # Ownership check and update share one transaction in the DAL
+        old_description_text = w_dal.update_description_to_word_db(
+            db, word_id, description_id, description_text, user_id
         )
+        if old_description_text is None:
+            raise NotFoundError(
+                f"Description with ID '{description_id}' not found or not accessible."
+            )
+        invalidate_cached_word(user_id, word_id)
 
         logger.info(
-            f"SERVICE: Successfully updated description '{description_id}' for user '{user_id}'."
+            "SERVICE: Successfully updated description '%s' for user '%s'.",
+            description_id,
+            user_id,
         )
         return {
             "message": f"Description '{old_description_text}' successfully updated to '{description_text}'.",
@@ -141,7 +121,9 @@ def update_description_for_user(
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during description update for '{description_id}': {e}",
+            "SERVICE: DatabaseError during description update for '%s': %s",
+            description_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -149,7 +131,9 @@ def update_description_for_user(
         ) from e
     except Exception as e:
         logger.error(
-            f"SERVICE: Unexpected error during description update for '{description_id}': {e}",
+            "SERVICE: Unexpected error during description update for '%s': %s",
+            description_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -161,18 +145,25 @@ def delete_description_for_user(
     db, user_id: str, word_id: str, description_id: str
 ) -> dict:
     """Deletes a description - like delete_category pattern"""
-    logger.info(
-        f"SERVICE: delete_description_for_user invoked for description '{description_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: delete_description_for_user invoked for description '%s' by user '%s'.",
+        description_id,
+        user_id,
     )
     try:
-        # Verify ownership first (reuse helper)
-        _get_description_by_id_with_ownership(db, user_id, word_id, description_id)
-
-        # Delete the description using DAL
-        w_dal.delete_description_from_word_db(db, word_id, description_id)
+        # Ownership check and delete share one transaction in the DAL
+        if not w_dal.delete_description_from_word_db(
+            db, word_id, description_id, user_id
+        ):
+            raise NotFoundError(
+                f"Description with ID '{description_id}' not found or not accessible."
+            )
+        invalidate_cached_word(user_id, word_id)
 
         logger.info(
-            f"SERVICE: Successfully deleted description '{description_id}' for user '{user_id}'."
+            "SERVICE: Successfully deleted description '%s' for user '%s'.",
+            description_id,
+            user_id,
         )
         return {
             "message": f"Description deleted successfully from word '{word_id}'.",
@@ -184,7 +175,9 @@ def delete_description_for_user(
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during description deletion for '{description_id}': {e}",
+            "SERVICE: DatabaseError during description deletion for '%s': %s",
+            description_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -192,7 +185,9 @@ def delete_description_for_user(
         ) from e
     except Exception as e:
         logger.error(
-            f"SERVICE: Unexpected error during description deletion for '{description_id}': {e}",
+            "SERVICE: Unexpected error during description deletion for '%s': %s",
+            description_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -6,31 +6,39 @@ from data_access import word_dal as w_dal
 from factories import WordFactory
 from utils import DatabaseError, NotFoundError, ForbiddenError, WordServiceError
 
+from .word_service import invalidate_cached_word
+
 logger = logging.getLogger("infinite_vocab_app")
 
 
 def star_word_for_user(db, user_id: str, word_id: str) -> dict:
     """Stars a word and checks for milestone prompts - clean and focused"""
-    logger.info(
-        f"SERVICE: star_word_for_user invoked for word '{word_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: star_word_for_user invoked for word '%s' by user '%s'.",
+        word_id,
+        user_id,
     )
     try:
-        # Use atomic transaction like the original
-        transaction = db.transaction()
-        atomic_result = w_dal.atomic_update(transaction, db, word_id, user_id)
+        # Atomic server-side increment; returns the post-increment count
+        star_result = w_dal.increment_word_stars(db, word_id, user_id)
 
-        if atomic_result == "NOT_FOUND":
+        if star_result == "NOT_FOUND":
             raise NotFoundError(f"Word with ID '{word_id}' not found.")
-        elif atomic_result == "FORBIDDEN":
+        elif star_result == "FORBIDDEN":
             raise ForbiddenError("You are not authorized to modify this word.")
 
-        new_star_count, word_text = atomic_result
+        new_star_count, word_text = star_result
+        invalidate_cached_word(user_id, word_id)
 
         # Use WordFactory for milestone validation - clean business logic
         milestone_prompts = WordFactory.validate_star_milestones(new_star_count)
 
         logger.info(
-            f"SERVICE: Star updated for word ID '{word_id}' (text: '{word_text}') for user_id: {user_id}. New stars: {new_star_count}"
+            "SERVICE: Star updated for word ID '%s' (text: '%s') for user_id: %s. New stars: %s",
+            word_id,
+            word_text,
+            user_id,
+            new_star_count,
         )
 
         return {
@@ -44,13 +52,17 @@ def star_word_for_user(db, user_id: str, word_id: str) -> dict:
     except (NotFoundError, ForbiddenError):
         raise
     except DatabaseError as e:
-        logger.error(f"SERVICE: DatabaseError starring word ID '{word_id}': {str(e)}")
+        logger.error(
+            "SERVICE: DatabaseError starring word ID '%s': %s", word_id, str(e)
+        )
         raise WordServiceError(
             "A database problem occurred while starring the word."
         ) from e
     except Exception as e:
         logger.error(
-            f"SERVICE: Unexpected error starring word ID '{word_id}': {str(e)}",
+            "SERVICE: Unexpected error starring word ID '%s': %s",
+            word_id,
+            str(e),
             exc_info=True,
         )
         raise WordServiceError(
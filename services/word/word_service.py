@@ -1,35 +1,125 @@
 """Core word service - Clean CRUD operations following category service pattern"""
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+from cachetools import TTLCache
+from firebase_admin import firestore
+
 from data_access import word_dal as w_dal
 from factories import WordFactory
 from models import Word
-from schemas import WordCreateSchema, WordUpdateSchema
-from utils import DatabaseError, DuplicateEntryError, NotFoundError, WordServiceError
+from schemas import (
+    DESCRIPTION_CREATE_ADAPTER,
+    EXAMPLE_CREATE_ADAPTER,
+    WordCreateSchema,
+    WordUpdateSchema,
+)
+from services.search_service import invalidate_search_cache
+from utils import (
+    DatabaseError,
+    DuplicateEntryError,
+    NotFoundError,
+    WordServiceError,
+    cached_for_request,
+    invalidate_request_cache,
+)
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# Server timestamp sentinels for new documents; they are stateless, so one
+# shared mapping can be spread into every create payload.
+_CREATE_TIMESTAMPS = {
+    "createdAt": firestore.SERVER_TIMESTAMP,
+    "updatedAt": firestore.SERVER_TIMESTAMP,
+}
+
+
+# A word's descriptions are read on this pool while the request thread reads
+# its examples. WORD_ENTRY_FETCH_MAX_WORKERS caps the threads per process.
+WORD_ENTRY_FETCH_MAX_WORKERS = int(os.environ.get("WORD_ENTRY_FETCH_MAX_WORKERS", 8))
+_entry_fetch_executor = ThreadPoolExecutor(
+    max_workers=WORD_ENTRY_FETCH_MAX_WORKERS, thread_name_prefix="word-entries"
+)
+
+# Existence checks fire on every keystroke of the add-word form, so answers are
+# kept briefly per (user, lowercased text). Local creates record the new word
+# and other local writes drop the affected keys; writes from other processes
+# show up once the TTL expires.
+WORD_EXISTS_CACHE_TTL_SECONDS = int(os.environ.get("WORD_EXISTS_CACHE_TTL", 5))
+_exists_cache = TTLCache(maxsize=10_000, ttl=WORD_EXISTS_CACHE_TTL_SECONDS)
+_exists_cache_lock = threading.Lock()
+
+
+def _invalidate_word_exists(user_id: str, *word_texts_search: str) -> None:
+    """Drops cached existence answers for the given lowercased word texts."""
+    with _exists_cache_lock:
+        for word_text_search in word_texts_search:
+            _exists_cache.pop((user_id, word_text_search), None)
+
+
+def _remember_word_exists(user_id: str, word_text_search: str, word_id: str) -> None:
+    """Records that a word is known to exist, so a repeat submit skips the query."""
+    with _exists_cache_lock:
+        _exists_cache[(user_id, word_text_search)] = {
+            "exists": True,
+            "word_id": word_id,
+        }
+
+
+def _word_summary_cache_key(word_id: str) -> tuple:
+    """Request-cache key for a word's owner/text summary."""
+    return ("word_summary", word_id)
+
+
+def _word_details_cache_key(user_id: str, word_id: str) -> tuple:
+    """Request-cache key for a user's full word with its entries."""
+    return ("word_details", user_id, word_id)
+
+
+def invalidate_cached_word(user_id: str, word_id: str) -> None:
+    """Drops the request-cached copies of a word after a write to it or its entries."""
+    invalidate_request_cache(_word_details_cache_key(user_id, word_id))
+    invalidate_request_cache(_word_summary_cache_key(word_id))
+
 
 def get_word_details_for_user(db, user_id: str, word_id: str) -> Word:
     """Retrieves a word by ID with user ownership validation - like get_category_by_id"""
-    logger.info(
-        f"SERVICE: get_word_details_for_user invoked for word '{word_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: get_word_details_for_user invoked for word '%s' by user '%s'.",
+        word_id,
+        user_id,
     )
     try:
-        word = w_dal.get_word_by_id(db, word_id)  # DAL returns Word model now!
-        if not word:
-            raise NotFoundError(f"Word with ID '{word_id}' not found.")
-        if word.user_id != user_id:  # Simple property access like category
-            logger.warning(
-                f"SERVICE: Ownership check failed for word '{word_id}'. Requester: '{user_id}', Owner: '{word.user_id}'."
+        # Ownership is filtered in the query, so another user's word reads as missing
+        def load_word():
+            word = w_dal.get_word_for_user(db, user_id, word_id)
+            if not word:
+                return None
+            # Ownership is settled, so both subcollections load side by side
+            descriptions_future = _entry_fetch_executor.submit(
+                w_dal.get_all_descriptions_for_word, db, word_id
+            )
+            examples = w_dal.get_all_examples_for_word(db, word_id)
+            return word.model_copy(
+                update={
+                    "descriptions": descriptions_future.result(),
+                    "examples": examples,
+                }
             )
+
+        word = cached_for_request(_word_details_cache_key(user_id, word_id), load_word)
+        if not word:
             raise NotFoundError(f"Word with ID '{word_id}' not found.")
         return word
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during get_word_details_for_user for '{word_id}': {e}",
+            "SERVICE: DatabaseError during get_word_details_for_user for '%s': %s",
+            word_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -37,52 +127,63 @@ def get_word_details_for_user(db, user_id: str, word_id: str) -> Word:
         ) from e
 
 
+def verify_word_ownership(db, user_id: str, word_id: str) -> dict:
+    """
+    Raises NotFoundError unless the word exists and belongs to the user.
+    Returns the word's user_id and word_text without loading the full word.
+    """
+    try:
+        word_summary = cached_for_request(
+            _word_summary_cache_key(word_id),
+            lambda: w_dal.get_word_summary(db, word_id),
+        )
+    except DatabaseError as e:
+        logger.error(
+            "SERVICE: DatabaseError during verify_word_ownership for '%s': %s",
+            word_id,
+            e,
+            exc_info=True,
+        )
+        raise WordServiceError(
+            "Could not retrieve word due to a database issue."
+        ) from e
+    if not word_summary:
+        raise NotFoundError(f"Word with ID '{word_id}' not found.")
+    if word_summary.get("user_id") != user_id:
+        logger.warning(
+            "SERVICE: Ownership check failed for word '%s'. Requester: '%s', Owner: '%s'.",
+            word_id,
+            user_id,
+            word_summary.get("user_id"),
+        )
+        raise NotFoundError(f"Word with ID '{word_id}' not found.")
+    return word_summary
+
+
 def create_word_for_user(db, user_id: str, schema: WordCreateSchema) -> Word:
     """Creates a new word for a user with duplicate validation - like create_category"""
-    logger.info(
-        f"SERVICE: create_word_for_user invoked for user '{user_id}' with word '{schema.word_text}'."
+    logger.debug(
+        "SERVICE: create_word_for_user invoked for user '%s' with word '%s'.",
+        user_id,
+        schema.word_text,
     )
     try:
-        # Check for duplicates using case-insensitive search
-        existing_word_id = w_dal.find_word_by_text_for_user(
-            db, user_id, schema.word_text
-        )
-        if existing_word_id:
-            logger.warning(
-                f"SERVICE: Duplicate found: Word '{schema.word_text}' for user '{user_id}' (ID: {existing_word_id})."
-            )
-            raise DuplicateEntryError(
-                f"Word '{schema.word_text}' already exists in your list. Try adding a star to the existing entry instead?",
-                conflicting_id=existing_word_id,
-            )
-
         # Create Word model using factory - like category
         word_model = WordFactory.create_from_schema(schema, user_id)
 
         # Prepare data for the MAIN WORD document
-        from firebase_admin import firestore
-
         word_document_data = {
             "word_text": word_model.word_text,
             "word_text_search": word_model.word_text_search,
             "word_stars": word_model.word_stars,
             "user_id": word_model.user_id,
-            "createdAt": firestore.SERVER_TIMESTAMP,
-            "updatedAt": firestore.SERVER_TIMESTAMP,
+            **_CREATE_TIMESTAMPS,
         }
 
-        # Create the MAIN WORD document using the DAL
-        _timestamp, new_word_ref = w_dal.add_word_to_db(db, word_document_data)
-        created_word_id = new_word_ref.id
-
-        logger.info(
-            f"SERVICE: Word '{schema.word_text}' added with ID: {created_word_id} for user '{user_id}'."
-        )
-
         # Create initial description using factory
-        from schemas import DescriptionCreateSchema
-
-        desc_schema = DescriptionCreateSchema(description_text=schema.description_text)
+        desc_schema = DESCRIPTION_CREATE_ADAPTER.validate_python(
+            {"description_text": schema.description_text}
+        )
         initial_desc_model = WordFactory.create_description_from_schema(
             desc_schema, user_id, is_initial=True
         )
@@ -90,15 +191,14 @@ def create_word_for_user(db, user_id: str, schema: WordCreateSchema) -> Word:
         initial_desc_data = {
             "description_text": initial_desc_model.description_text,
             "is_initial": initial_desc_model.is_initial,
-            "createdAt": firestore.SERVER_TIMESTAMP,
+            "createdAt": _CREATE_TIMESTAMPS["createdAt"],
             "user_id": initial_desc_model.user_id,
         }
-        w_dal.append_description_to_word_db(db, created_word_id, initial_desc_data)
 
         # Create initial example using factory
-        from schemas import ExampleCreateSchema
-
-        example_schema = ExampleCreateSchema(example_text=schema.example_text)
+        example_schema = EXAMPLE_CREATE_ADAPTER.validate_python(
+            {"example_text": schema.example_text}
+        )
         initial_example_model = WordFactory.create_example_from_schema(
             example_schema, user_id, is_initial=True
         )
@@ -106,16 +206,71 @@ def create_word_for_user(db, user_id: str, schema: WordCreateSchema) -> Word:
         initial_ex_data = {
             "example_text": initial_example_model.example_text,
             "is_initial": initial_example_model.is_initial,
-            "createdAt": firestore.SERVER_TIMESTAMP,
+            "createdAt": _CREATE_TIMESTAMPS["createdAt"],
             "user_id": initial_example_model.user_id,
         }
-        w_dal.append_example_to_word_db(db, created_word_id, initial_ex_data)
 
-        # Fetch the created word with all subcollections
-        word_model = w_dal.get_word_by_id(db, created_word_id)
+        # The duplicate check and all writes share one transaction in the DAL
+        try:
+            timestamp, new_word_ref, new_desc_ref, new_example_ref = (
+                w_dal.create_word_transactional(
+                    db, user_id, word_document_data, initial_desc_data, initial_ex_data
+                )
+            )
+        except DuplicateEntryError as e:
+            logger.warning(
+                "SERVICE: Duplicate found: Word '%s' for user '%s' (ID: %s).",
+                schema.word_text,
+                user_id,
+                e.conflicting_id,
+            )
+            _remember_word_exists(
+                user_id, word_model.word_text_search, e.conflicting_id
+            )
+            raise DuplicateEntryError(
+                f"Word '{schema.word_text}' already exists in your list. Try adding a star to the existing entry instead?",
+                conflicting_id=e.conflicting_id,
+            ) from e
+        invalidate_search_cache(user_id)
+        created_word_id = new_word_ref.id
+        _remember_word_exists(user_id, word_model.word_text_search, created_word_id)
+
+        logger.info(
+            "SERVICE: Word '%s' added with ID: %s for user '%s'.",
+            schema.word_text,
+            created_word_id,
+            user_id,
+        )
+
+        # Everything written is known locally, so build the response without re-reading
+        word_model = word_model.model_copy(
+            update={
+                "word_id": created_word_id,
+                "created_at": timestamp,
+                "updated_at": timestamp,
+                "descriptions": [
+                    initial_desc_model.model_copy(
+                        update={
+                            "description_id": new_desc_ref.id,
+                            "created_at": timestamp,
+                        }
+                    )
+                ],
+                "examples": [
+                    initial_example_model.model_copy(
+                        update={
+                            "example_id": new_example_ref.id,
+                            "created_at": timestamp,
+                        }
+                    )
+                ],
+            }
+        )
 
         logger.info(
-            f"SERVICE: Successfully created word '{schema.word_text}' for user '{user_id}'."
+            "SERVICE: Successfully created word '%s' for user '%s'.",
+            schema.word_text,
+            user_id,
         )
         return word_model
 
@@ -123,7 +278,9 @@ def create_word_for_user(db, user_id: str, schema: WordCreateSchema) -> Word:
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during word creation for user '{user_id}': {e}",
+            "SERVICE: DatabaseError during word creation for user '%s': %s",
+            user_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -131,7 +288,9 @@ def create_word_for_user(db, user_id: str, schema: WordCreateSchema) -> Word:
         ) from e
     except Exception as e:
         logger.error(
-            f"SERVICE: Unexpected error during word creation for user '{user_id}': {e}",
+            "SERVICE: Unexpected error during word creation for user '%s': %s",
+            user_id,
+            e,
             exc_info=True,
         )
         raise
@@ -141,31 +300,63 @@ def update_word_for_user(
     db, user_id: str, word_id: str, schema: WordUpdateSchema
 ) -> Word:
     """Updates a word with user validation - like update_category"""
-    logger.info(
-        f"SERVICE: update_word_for_user invoked for word '{word_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: update_word_for_user invoked for word '%s' by user '%s'.",
+        word_id,
+        user_id,
     )
     try:
-        existing_word = get_word_details_for_user(
-            db, user_id, word_id
-        )  # Reuse ownership check!
+        # Read the full word once; it checks ownership and becomes the response
+        existing_word = get_word_details_for_user(db, user_id, word_id)
         updates = WordFactory.create_word_update_dict(schema)
+        # Drop fields that already hold the requested value; if nothing is left
+        # the PATCH is a no-op and needs no write.
+        updates = {
+            field: value
+            for field, value in updates.items()
+            if getattr(existing_word, field) != value
+        }
         if not updates:
             return existing_word
 
-        # Update the word using DAL
-        w_dal.update_word_by_id(db, word_id, schema.word_text)
+        # The duplicate check and the rename share one transaction in the DAL
+        try:
+            updated_at = w_dal.update_word_by_id(
+                db, word_id, schema.word_text, user_id, existing_word.word_text_search
+            )
+        except DuplicateEntryError as e:
+            logger.warning(
+                "SERVICE: Duplicate found: Word '%s' for user '%s' (ID: %s).",
+                schema.word_text,
+                user_id,
+                e.conflicting_id,
+            )
+            _remember_word_exists(user_id, schema.word_text.lower(), e.conflicting_id)
+            raise DuplicateEntryError(
+                f"Word '{schema.word_text}' already exists in your list.",
+                conflicting_id=e.conflicting_id,
+            ) from e
+        invalidate_search_cache(user_id)
+        _invalidate_word_exists(
+            user_id, existing_word.word_text_search, schema.word_text.lower()
+        )
+        invalidate_cached_word(user_id, word_id)
 
-        # Fetch the updated word
-        updated_word = get_word_details_for_user(db, user_id, word_id)
+        # Apply the written fields locally instead of fetching the word again
+        updated_word = existing_word.model_copy(
+            update={**updates, "updated_at": updated_at}
+        )
 
-        logger.info(f"SERVICE: Successfully updated word '{word_id}'.")
+        logger.info("SERVICE: Successfully updated word '%s'.", word_id)
         return updated_word
 
-    except (NotFoundError, WordServiceError):
+    except (DuplicateEntryError, NotFoundError, WordServiceError):
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during word update for '{word_id}': {e}",
+            "SERVICE: DatabaseError during word update for '%s': %s",
+            word_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError("Could not update word due to a database issue.") from e
@@ -173,26 +364,33 @@ def update_word_for_user(
 
 def delete_word_for_user(db, user_id: str, word_id: str) -> dict:
     """Deletes a word with user ownership validation - like delete_category"""
-    logger.info(
-        f"SERVICE: delete_word_for_user invoked for word '{word_id}' by user '{user_id}'."
+    logger.debug(
+        "SERVICE: delete_word_for_user invoked for word '%s' by user '%s'.",
+        word_id,
+        user_id,
     )
     try:
-        word_to_delete = get_word_details_for_user(
-            db, user_id, word_id
-        )  # Reuse ownership check!
+        word_to_delete = verify_word_ownership(db, user_id, word_id)
 
         # Delete word using DAL
-        w_dal.delete_word_by_id(db, word_id)
+        w_dal.delete_word_by_id(
+            db, word_id, user_id, word_to_delete["word_text_search"]
+        )
+        invalidate_search_cache(user_id)
+        _invalidate_word_exists(user_id, word_to_delete["word_text_search"])
+        invalidate_cached_word(user_id, word_id)
 
         return {
-            "message": f"Word '{word_to_delete.word_text}' deleted successfully.",
+            "message": f"Word '{word_to_delete['word_text']}' deleted successfully.",
             "word_id": word_id,
         }
     except (NotFoundError, WordServiceError):
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during word deletion for '{word_id}': {e}",
+            "SERVICE: DatabaseError during word deletion for '%s': %s",
+            word_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError("Could not delete word due to a database issue.") from e
@@ -200,7 +398,7 @@ def delete_word_for_user(db, user_id: str, word_id: str) -> dict:
 
 def list_words_for_user(db, user_id: str) -> List[Word]:
     """Retrieves all words for a user, sorted by stars - like get_categories_by_user"""
-    logger.info(f"SERVICE: list_words_for_user invoked for user '{user_id}'.")
+    logger.debug("SERVICE: list_words_for_user invoked for user '%s'.", user_id)
     try:
         words = w_dal.get_all_words_for_user_sorted_by_stars(
             db, user_id
@@ -208,7 +406,9 @@ def list_words_for_user(db, user_id: str) -> List[Word]:
         return words
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during word retrieval for user '{user_id}': {e}",
+            "SERVICE: DatabaseError during word retrieval for user '%s': %s",
+            user_id,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
@@ -218,18 +418,34 @@ def list_words_for_user(db, user_id: str) -> List[Word]:
 
 def check_word_exists(db, user_id: str, word_text: str) -> dict:
     """Checks if a word exists for a user and returns its status"""
-    logger.info(
-        f"SERVICE: check_word_exists invoked for user '{user_id}' with word '{word_text}'."
+    logger.debug(
+        "SERVICE: check_word_exists invoked for user '%s' with word '%s'.",
+        user_id,
+        word_text,
     )
+    cache_key = (user_id, word_text.lower())
+    with _exists_cache_lock:
+        cached_result = _exists_cache.get(cache_key)
+    if cached_result is not None:
+        logger.debug(
+            "SERVICE: Returning cached existence check for user '%s'.", user_id
+        )
+        return dict(cached_result)
+
     try:
         existing_word_id = w_dal.find_word_by_text_for_user(db, user_id, word_text)
         if existing_word_id:
-            return {"exists": True, "word_id": existing_word_id}
+            result = {"exists": True, "word_id": existing_word_id}
         else:
-            return {"exists": False, "word_id": None}
+            result = {"exists": False, "word_id": None}
+        with _exists_cache_lock:
+            _exists_cache[cache_key] = result
+        return dict(result)
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError during word existence check for '{word_text}': {e}",
+            "SERVICE: DatabaseError during word existence check for '%s': %s",
+            word_text,
+            e,
             exc_info=True,
         )
         raise WordServiceError(
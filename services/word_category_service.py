@@ -1,39 +1,93 @@
 """Word-Category Service Layer"""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+from pydantic import TypeAdapter
+
 from data_access import category_dal as c_dal
 from data_access import word_category_dal as wc_dal
 from data_access import word_dal as w_dal
-from utils import DatabaseError, DuplicateEntryError, NotFoundError, WordServiceError
+from models import Word
+from utils import (
+    DatabaseError,
+    DuplicateEntryError,
+    NotFoundError,
+    WordServiceError,
+    cached_for_request,
+)
 
 logger = logging.getLogger("infinite_vocab_app")
 
+# Independent reads (a word's descriptions and examples, link preflight checks)
+# are fetched side by side on a shared pool. WORD_FETCH_MAX_WORKERS caps the
+# threads per process.
+WORD_FETCH_MAX_WORKERS = int(os.environ.get("WORD_FETCH_MAX_WORKERS", 16))
+_word_fetch_executor = ThreadPoolExecutor(
+    max_workers=WORD_FETCH_MAX_WORKERS, thread_name_prefix="word-fetch"
+)
+# Number of word ids per get_all call when listing a category's words.
+WORD_FETCH_WINDOW_SIZE = 30
+
+
+# Serializes a whole list of words through pydantic-core in a single call
+_WORD_LIST_ADAPTER = TypeAdapter(List[Word])
+
+
+def _fetch_link_preflight(
+    db, user_id: str, word_id: str, category_id: str, check_link: bool = True
+):
+    """
+    Reads the caller's word, the category and (optionally) the link state concurrently.
+    link_exists is None when check_link is False.
+    """
+    word_future = _word_fetch_executor.submit(
+        w_dal.get_word_for_user, db, user_id, word_id
+    )
+    category_future = _word_fetch_executor.submit(
+        c_dal.get_category_by_id, db, category_id
+    )
+    link_future = (
+        _word_fetch_executor.submit(wc_dal.check_link_exists, db, word_id, category_id)
+        if check_link
+        else None
+    )
+    return (
+        word_future.result(),
+        category_future.result(),
+        link_future.result() if link_future else None,
+    )
+
 
 def add_word_to_category(db, user_id: str, category_id: str, word_id: str) -> dict:
     """Orchestrates adding a word to a category and returns a descriptive success message."""
-    logger.info(
-        f"SERVICE: Linking word {word_id} to category {category_id} for user {user_id}."
+    logger.debug(
+        "SERVICE: Linking word %s to category %s for user %s.",
+        word_id,
+        category_id,
+        user_id,
     )
     try:
-        word_model = w_dal.get_word_by_id(db, word_id)
-        if not word_model or word_model.user_id != user_id:
+        # No link preflight: the link's create() rejects an existing link
+        word_model, category, _ = _fetch_link_preflight(
+            db, user_id, word_id, category_id, check_link=False
+        )
+        if not word_model:
             raise NotFoundError("Word not found or access is forbidden.")
 
-        category = c_dal.get_category_by_id(db, category_id)
         if not category or category.user_id != user_id:
             raise NotFoundError("Category not found or access is forbidden.")
 
-        if wc_dal.check_link_exists(db, word_id, category_id):
-            raise DuplicateEntryError("Word is already in this category.")
-
         wc_dal.link_word_to_category(db, user_id, word_id, category_id)
 
         word_name = word_model.word_text
         category_name = category.category_name
         logger.info(
-            f"SERVICE: Successfully linked word '{word_name}' to category '{category_name}'."
+            "SERVICE: Successfully linked word '%s' to category '%s'.",
+            word_name,
+            category_name,
         )
         return {
             "message": f"Word '{word_name}' successfully added to category '{category_name}'."
@@ -41,12 +95,18 @@ def add_word_to_category(db, user_id: str, category_id: str, word_id: str) -> di
 
     except (NotFoundError, DuplicateEntryError) as e:
         logger.warning(
-            f"SERVICE: Client error linking word {word_id} to category {category_id}: {e}"
+            "SERVICE: Client error linking word %s to category %s: %s",
+            word_id,
+            category_id,
+            e,
         )
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError linking word {word_id} to category {category_id}: {e}"
+            "SERVICE: DatabaseError linking word %s to category %s: %s",
+            word_id,
+            category_id,
+            e,
         )
         raise WordServiceError(
             "A database error occurred while linking the word to the category."
@@ -55,19 +115,23 @@ def add_word_to_category(db, user_id: str, category_id: str, word_id: str) -> di
 
 def remove_word_from_category(db, user_id: str, category_id: str, word_id: str) -> dict:
     """Orchestrates removing a word from a category and returns a descriptive success message."""
-    logger.info(
-        f"SERVICE: Unlinking word {word_id} from category {category_id} for user {user_id}."
+    logger.debug(
+        "SERVICE: Unlinking word %s from category %s for user %s.",
+        word_id,
+        category_id,
+        user_id,
     )
     try:
-        word_model = w_dal.get_word_by_id(db, word_id)
-        if not word_model or word_model.user_id != user_id:
+        word_model, category, link_exists = _fetch_link_preflight(
+            db, user_id, word_id, category_id
+        )
+        if not word_model:
             raise NotFoundError("Word not found or access is forbidden.")
 
-        category = c_dal.get_category_by_id(db, category_id)
         if not category or category.user_id != user_id:
             raise NotFoundError("Category not found or access is forbidden.")
 
-        if not wc_dal.check_link_exists(db, word_id, category_id):
+        if not link_exists:
             raise NotFoundError("This word is not in the specified category.")
 
         wc_dal.unlink_word_from_category(db, word_id, category_id)
@@ -75,7 +139,9 @@ def remove_word_from_category(db, user_id: str, category_id: str, word_id: str)
         word_name = word_model.word_text
         category_name = category.category_name
         logger.info(
-            f"SERVICE: Successfully unlinked word '{word_name}' from category '{category_name}'."
+            "SERVICE: Successfully unlinked word '%s' from category '%s'.",
+            word_name,
+            category_name,
         )
         return {
             "message": f"Word '{word_name}' successfully removed from category '{category_name}'."
@@ -83,12 +149,18 @@ def remove_word_from_category(db, user_id: str, category_id: str, word_id: str)
 
     except NotFoundError as e:
         logger.warning(
-            f"SERVICE: NotFound error unlinking word {word_id} from category {category_id}: {e}"
+            "SERVICE: NotFound error unlinking word %s from category %s: %s",
+            word_id,
+            category_id,
+            e,
         )
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError unlinking word {word_id} from category {category_id}: {e}"
+            "SERVICE: DatabaseError unlinking word %s from category %s: %s",
+            word_id,
+            category_id,
+            e,
         )
 
         raise WordServiceError(
@@ -98,39 +170,59 @@ def remove_word_from_category(db, user_id: str, category_id: str, word_id: str)
 
 def get_words_for_category(db, user_id: str, category_id: str) -> List[dict]:
     """Gets all words belonging to a specific category for a user."""
-    logger.info(
-        f"SERVICE: Getting words for category {category_id} for user {user_id}."
+    logger.debug(
+        "SERVICE: Getting words for category %s for user %s.", category_id, user_id
     )
     try:
-        category = c_dal.get_category_by_id(db, category_id)
+        # Same request-cache key as category_service.get_category_by_id
+        category = cached_for_request(
+            ("category", category_id),
+            lambda: c_dal.get_category_by_id(db, category_id),
+        )
         if not category or category.user_id != user_id:
             raise NotFoundError("Category not found or access is forbidden.")
 
-        word_ids = wc_dal.get_word_ids_by_category_id(db, category_id)
-        if not word_ids:
-            return []
-
-        words_list = []
-        for word_id in word_ids:
-            word_model = w_dal.get_word_by_id(db, word_id)
-            if word_model and word_model.user_id == user_id:
-                # Convert Word model to dict for backward compatibility
-                word_data = word_model.model_dump(by_alias=True)
-                words_list.append(word_data)
+        # Word documents are multi-fetched in windows while the link query is
+        # still streaming, so the two waves of reads overlap.
+        window_futures = []
+        window = []
+        for word_id in wc_dal.get_word_ids_by_category_id(db, category_id):
+            window.append(word_id)
+            if len(window) == WORD_FETCH_WINDOW_SIZE:
+                window_futures.append(
+                    _word_fetch_executor.submit(w_dal.get_words_by_ids, db, window)
+                )
+                window = []
+        if window:
+            window_futures.append(
+                _word_fetch_executor.submit(w_dal.get_words_by_ids, db, window)
+            )
+
+        # Windows are read back in submission order to keep the link order;
+        # only the caller's words get their descriptions and examples loaded.
+        entry_futures = [
+            _word_fetch_executor.submit(w_dal.load_word_entries, db, word_model)
+            for window_future in window_futures
+            for word_model in window_future.result()
+            if word_model.user_id == user_id
+        ]
+        word_models = [entry_future.result() for entry_future in entry_futures]
+        # Convert Word models to dicts for backward compatibility, in one pass
+        words_list = _WORD_LIST_ADAPTER.dump_python(word_models, by_alias=True)
 
         logger.info(
-            f"SERVICE: Found {len(words_list)} words for category {category_id}."
+            "SERVICE: Found %s words for category %s.", len(words_list), category_id
         )
         return words_list
 
     except NotFoundError as e:
         logger.warning(
-            f"SERVICE: NotFound error getting words for category {category_id}: {e}"
+            "SERVICE: NotFound error getting words for category %s: %s", category_id, e
         )
         raise
     except DatabaseError as e:
         logger.error(
-            f"SERVICE: DatabaseError getting words for category {category_id}: {e}"
+            "SERVICE: DatabaseError getting words for category %s: %s", category_id, e
         )
         raise WordServiceError(
             "A database error occurred while retrieving words for the category."
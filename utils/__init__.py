@@ -14,8 +14,9 @@ from .exceptions import (
     ValidationError,
     WordServiceError,
 )
-from .helpers import generate_random_code
+from .helpers import generate_random_code, stream_json_array
 from .logging import log_response, setup_logging, timed_execution
+from .request_cache import cached_for_request, invalidate_request_cache
 # No more response helpers needed
 
 __all__ = [
@@ -33,8 +34,12 @@ __all__ = [
     "UserServiceError",
     # Helpers
     "generate_random_code",
+    "stream_json_array",
     # Logging
     "setup_logging",
     "timed_execution",
     "log_response",
+    # Request cache
+    "cached_for_request",
+    "invalidate_request_cache",
 ]
@@ -1,10 +1,34 @@
 import random
 import string
+from typing import Any, Iterable, Iterator
+
+from flask import current_app
+
+_CODE_CHARACTERS = string.ascii_uppercase + string.digits
+# User codes are shared identifiers, so draw them from the OS CSPRNG.
+_code_random = random.SystemRandom()
 
 
 def generate_random_code(length=8):
     """
     Helper function that generates a random code of 8 characters + numbers.
     """
-    characters = string.ascii_uppercase + string.digits
-    return "".join(random.choice(characters) for i in range(length))
+    return "".join(_code_random.choices(_CODE_CHARACTERS, k=length))
+
+
+def stream_json_array(items: Iterable[Any]) -> Iterator[str]:
+    """
+    Encodes an iterable as a JSON array, one element at a time.
+
+    Uses the app's JSON provider and compact separators so the output matches
+    `jsonify`, but never holds more than a single encoded element in memory.
+    Meant to be wrapped in `stream_with_context` and returned as a Flask
+    `Response`.
+    """
+    dumps = current_app.json.dumps
+    yield "["
+    for index, item in enumerate(items):
+        if index:
+            yield ","
+        yield dumps(item, separators=(",", ":"))
+    yield "]"
@@ -1,7 +1,10 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import time
 from functools import wraps
@@ -40,10 +43,20 @@ def setup_logging(log_level: Optional[str] = None):
             "%(asctime)s - [%(name)s] - [%(levelname)s] - %(message)s"
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        # Records are handed to a queue and written to stdout by a listener
+        # thread, so request threads never block on the stream write.
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        # Records are fully handled here; don't also pass them to root handlers
+        # (e.g. a server's own logging setup), which would write them twice.
+        logger.propagate = False
 
         # Log the configured level
-        logger.info(f"APP: Logging initialized at {logging.getLevelName(level)} level")
+        logger.info("APP: Logging initialized at %s level", logging.getLevelName(level))
 
     return logger
 
@@ -61,23 +74,33 @@ def log_response(logger, request, response, start_time=None):
     Returns:
         The original response object (for chaining)
     """
-    duration = ""
     if start_time:
-        duration = f" - Duration: {(time.time() - start_time) * 1000:.0f}ms"
-
-    logger.info(f"RESPONSE: {request.path} - Status: {response.status_code}{duration}")
-
-    # Log response body at DEBUG level for JSON responses
-    if logger.isEnabledFor(logging.DEBUG) and response.is_json:
+        logger.info(
+            "RESPONSE: %s - Status: %s - Duration: %.0fms",
+            request.path,
+            response.status_code,
+            (time.time() - start_time) * 1000,
+        )
+    else:
+        logger.info("RESPONSE: %s - Status: %s", request.path, response.status_code)
+
+    # Log response body at DEBUG level for JSON responses. Streamed bodies are
+    # skipped, since reading them here would buffer the whole stream.
+    if (
+        logger.isEnabledFor(logging.DEBUG)
+        and response.is_json
+        and not response.is_streamed
+    ):
         try:
-            # Get a copy of the response data without modifying the original
-            response_data = response.get_json(silent=True)
-            if response_data:
-                # Truncate large responses to avoid flooding logs
-                response_str = str(response_data)
-                if len(response_str) > 1000:
-                    response_str = response_str[:1000] + "... [truncated]"
-                logger.debug(f"RESPONSE BODY: {response_str}")
+            # Log the already-encoded body instead of parsing and re-stringifying it.
+            # Truncate large responses to avoid flooding logs; only the logged
+            # prefix is decoded.
+            raw_body = response.get_data().rstrip()
+            if raw_body:
+                response_str = raw_body[:1000].decode("utf-8", "replace")
+                if len(raw_body) > 1000:
+                    response_str += "... [truncated]"
+                logger.debug("RESPONSE BODY: %s", response_str)
         except Exception:
             # Don't let response logging errors affect the response
             pass
@@ -100,10 +123,16 @@ def timed_execution(logger, label: str) -> Callable:
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            # Timings are only logged at DEBUG, so skip the clock otherwise
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            duration = (time.time() - start_time) * 1000
-            logger.debug(f"TIMING: {label} completed in {duration:.0f}ms")
+            logger.debug(
+                "TIMING: %s completed in %dms",
+                label,
+                (time.perf_counter_ns() - start_ns) // 1_000_000,
+            )
             return result
 
         return wrapper
@@ -0,0 +1,30 @@
+"""Request-scoped memoization backed by Flask's `g` object."""
+
+from typing import Callable, Hashable, TypeVar
+
+from flask import g, has_request_context
+
+T = TypeVar("T")
+
+
+def cached_for_request(key: Hashable, loader: Callable[[], T]) -> T:
+    """
+    Returns the value stored under `key` for the current request.
+
+    On the first call for a key the loader runs and its result is kept on `g`,
+    so repeated reads within the same HTTP request cost nothing. Outside of a
+    request context the loader is simply called.
+    """
+    if not has_request_context():
+        return loader()
+
+    cache = g.setdefault("request_cache", {})
+    if key not in cache:
+        cache[key] = loader()
+    return cache[key]
+
+
+def invalidate_request_cache(key: Hashable) -> None:
+    """Drops `key` from the current request's cache after a mutating write."""
+    if has_request_context():
+        g.get("request_cache", {}).pop(key, None)